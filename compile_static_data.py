@@ -13,6 +13,18 @@ Output files:
 
 import json
 import os
+# Thread pool, not process pool: the solver stack loads Numba's
+# threading layer, which is not fork-safe (a forked worker deadlocks),
+# and spawn workers would re-import the whole solver for milliseconds
+# of work per tutorial. The tutorial builders release the GIL in their
+# numpy-heavy parts, so threads still overlap.
+from multiprocessing.dummy import Pool
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from solver.solve import CubeSolver
 from solver.patterns import (
     get_all_patterns,
@@ -22,6 +34,51 @@ from solver.patterns import (
 )
 
 
+def write_json(path, data):
+    """
+    Write compact JSON. The output is consumed by the web viewer, not
+    humans, so pretty-printing would only double the file size and the
+    serialization time.
+
+    Serialization happens before the file is opened, so a failure cannot
+    truncate an existing output file. OPT_NON_STR_KEYS matches stdlib
+    behavior for int dict keys (the by_layer tutorial stats).
+    """
+    if orjson is not None:
+        blob = orjson.dumps(
+            data,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    else:
+        blob = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(blob)
+
+
+def build_tutorial(args):
+    """
+    Build one tutorial entry from an (id, solution) pair.
+
+    Module-level so it can be dispatched to a pool worker; each tutorial
+    is independent of the others.
+    """
+    i, solution = args
+    ordered = order_solution_bfs(solution)
+    steps = generate_tutorial_steps(ordered)
+    stats = analyze_solution_patterns(ordered)
+
+    return {
+        "id": i,
+        "piece_count": len(solution),
+        "stats": {
+            "total_pieces": stats["total_pieces"],
+            "by_layer": stats["by_layer"],
+            "orientations": stats["orientations"]
+        },
+        "steps": steps
+    }
+
+
 def generate_static_data(num_solutions=50, num_tutorials=5):
     """Generate and save static patterns and tutorials."""
     
@@ -63,24 +120,14 @@ def generate_static_data(num_solutions=50, num_tutorials=5):
         "tutorials": []
     }
     
-    for i in range(min(num_tutorials, len(solutions))):
-        solution = solutions[i]
-        ordered = order_solution_bfs(solution)
-        steps = generate_tutorial_steps(ordered)
-        stats = analyze_solution_patterns(ordered)
-        
-        tutorials_data["tutorials"].append({
-            "id": i,
-            "piece_count": len(solution),
-            "stats": {
-                "total_pieces": stats["total_pieces"],
-                "by_layer": stats["by_layer"],
-                "orientations": stats["orientations"]
-            },
-            "steps": steps
-        })
-        
-        print(f"  Tutorial {i+1}: {len(steps)} steps")
+    # Tutorials are independent, so fan them out across worker threads
+    jobs = list(enumerate(solutions[:num_tutorials]))
+    if jobs:
+        with Pool(processes=min(len(jobs), os.cpu_count() or 1)) as pool:
+            tutorials_data["tutorials"] = pool.map(build_tutorial, jobs)
+
+    for t in tutorials_data["tutorials"]:
+        print(f"  Tutorial {t['id']+1}: {len(t['steps'])} steps")
     
     print(f"✓ Generated {len(tutorials_data['tutorials'])} tutorials\n")
     
@@ -90,15 +137,13 @@ def generate_static_data(num_solutions=50, num_tutorials=5):
     
     # Save patterns
     patterns_file = os.path.join(data_dir, "patterns.json")
-    with open(patterns_file, "w") as f:
-        json.dump(patterns_data, f, indent=2)
+    write_json(patterns_file, patterns_data)
     print(f"✓ Saved patterns to {patterns_file}")
     print(f"  - {len(patterns_data['patterns'])} patterns")
     
     # Save tutorials
     tutorials_file = os.path.join(data_dir, "tutorials.json")
-    with open(tutorials_file, "w") as f:
-        json.dump(tutorials_data, f, indent=2)
+    write_json(tutorials_file, tutorials_data)
     print(f"✓ Saved tutorials to {tutorials_file}")
     print(f"  - {len(tutorials_data['tutorials'])} tutorials")
     
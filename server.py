@@ -13,27 +13,36 @@ Usage:
 Then open http://localhost:8000
 """
 
+import functools
 import http.server
-import socketserver
 import json
 import os
+import shutil
+import socket
 import threading
+
+import numpy as np
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add solver to path
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from solver.placements import get_placements, NUM_CELLS
 from solver.exact_cover import build_dlx_matrix
-from solver.symmetry import SolutionSet, placements_to_pieces
+from solver.symmetry import SolutionSet, placements_to_pieces, cells_to_coords
 from solver.patterns import (
-    order_solution_for_tutorial, 
+    order_solution_for_tutorial,
     generate_tutorial_steps,
-    get_all_patterns,
-    get_pattern,
-    analyze_solution_patterns
+    get_all_patterns_incremental,
+    analyze_solution_patterns,
+    PatternAccumulator
 )
 
 PORT = 8000
@@ -43,66 +52,223 @@ WEB_DIR = Path(__file__).parent / "web"
 solver_lock = threading.Lock()
 all_placements = None
 solution_set = None
-dlx_generator = None
+dlx_solver = None
 is_solving = False
 
+# Serialization cache: each solution is serialized to JSON bytes once,
+# when it is found; /api/solutions streams these fragments directly.
+_solution_blobs = []  # per-solution pre-serialized JSON fragments
+
+# Incremental pattern extraction: new solutions are folded into the
+# accumulator as they arrive; the resulting pattern list is cached and
+# only rebuilt when the solution count changes. The lock serializes the
+# read-fold-cache sequence: each solution must be folded exactly once,
+# and the threaded server can run /api/patterns requests concurrently.
+_patterns_lock = threading.Lock()
+_pattern_accumulator = PatternAccumulator()
+_patterns_cache = None  # (solution_count, pattern list)
+
+# Tutorial responses are deterministic functions of the solution, and
+# solution ids are append-only, so each body is computed at most once.
+_tutorial_cache = {}  # solution_id -> pre-serialized JSON response body
+
+
+def get_current_patterns() -> list:
+    """Get the pattern list for the current solution set, cached by count."""
+    global _patterns_cache
+
+    with _patterns_lock:
+        count = len(solution_set) if solution_set else 0
+        if _patterns_cache is not None and _patterns_cache[0] == count:
+            return _patterns_cache[1]
+
+        # Fold only the solutions added since the last call
+        new_solutions = [
+            cells_to_coords(sol).tolist()
+            for sol in solution_set.solutions[_pattern_accumulator.num_solutions:count]
+        ] if solution_set else []
+        _pattern_accumulator.update(new_solutions)
+
+        patterns = get_all_patterns_incremental(_pattern_accumulator)
+        _patterns_cache = (count, patterns)
+        return patterns
+
+
+@functools.lru_cache(maxsize=128)
+def get_pattern_by_id(pattern_id: str, version: int):
+    """
+    Look up a single pattern, memoized by (id, solution count).
+
+    The version key makes stale entries unreachable when new solutions
+    change the extracted pattern set, without any explicit invalidation.
+    """
+    for p in get_current_patterns():
+        if p["id"] == pattern_id:
+            return p
+    return None
+
+
+def dumps_bytes(data) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches stdlib behavior for int dict keys
+        # (e.g. the by_layer tutorial stats)
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode('utf-8')
+
+
+def warmup_jit():
+    """
+    Force Numba compilation of the search kernel before the first request.
+
+    The kernel is compiled with cache=True, so on warm restarts this just
+    loads the cached artifact; on cold starts it pays the compile cost here,
+    on the init thread, instead of stalling the first /api/generate request.
+    A tiny throwaway exact-cover instance is solved so the real matrix's
+    resumable search state is left untouched.
+    """
+    warmup = build_dlx_matrix(2, [[0], [1], [0, 1]])
+    for _ in warmup.solve():
+        pass
+
 
 def init_solver():
     """Initialize the solver state."""
-    global all_placements, solution_set, dlx_generator
-    
+    global all_placements, solution_set, dlx_solver
+
     print("Initializing solver...")
     all_placements = get_placements()
     solution_set = SolutionSet()
-    
+
     # Build DLX matrix
-    dlx = build_dlx_matrix(NUM_CELLS, [list(p) for p in all_placements])
-    dlx_generator = dlx.solve()
-    
+    dlx_solver = build_dlx_matrix(NUM_CELLS, [list(p) for p in all_placements])
+
+    warmup_jit()
+
     print(f"Solver ready. {len(all_placements)} placements loaded.")
 
 
 def generate_solutions(count: int) -> list:
     """Generate up to `count` new unique solutions."""
-    global dlx_generator, is_solving
-    
-    if dlx_generator is None:
+    global is_solving
+
+    if dlx_solver is None:
         init_solver()
-    
+
     new_solutions = []
-    
+
     with solver_lock:
         is_solving = True
         try:
             found = 0
-            for solution_rows in dlx_generator:
-                pieces = placements_to_pieces(solution_rows, all_placements)
-                
-                if solution_set.add(pieces):
-                    # Convert to JSON-serializable format
-                    solution_data = {
-                        "id": len(solution_set) - 1,
-                        "pieces": [[[x, y, z] for x, y, z in piece] for piece in pieces]
-                    }
-                    new_solutions.append(solution_data)
-                    found += 1
-                    
-                    if found >= count:
-                        break
-        except StopIteration:
-            pass
+            while found < count and not dlx_solver.exhausted:
+                # Pull a whole batch of raw solutions per kernel call
+                # instead of re-entering Python for each one, and
+                # fingerprint the batch across threads in one shot
+                rows_batch = dlx_solver.solve_batch(count)
+                if not rows_batch:
+                    continue
+                pieces_batch = np.stack([
+                    placements_to_pieces(rows, all_placements)
+                    for rows in rows_batch
+                ])
+
+                # add_batch inserts the whole batch before we iterate, so
+                # ids come from a counter snapshotted beforehand: each new
+                # solution's id is its index in solution_set.solutions
+                next_id = len(solution_set)
+                for pieces, is_new in zip(pieces_batch,
+                                          solution_set.add_batch(pieces_batch)):
+                    if is_new:
+                        # Decode the packed cells to coordinates and build
+                        # the nested lists in one C call each
+                        solution_data = {
+                            "id": next_id,
+                            "pieces": cells_to_coords(pieces).tolist()
+                        }
+                        next_id += 1
+                        new_solutions.append(solution_data)
+                        # Serialize once now; cached blobs are streamed on demand
+                        _solution_blobs.append(dumps_bytes(solution_data))
+                        found += 1
         finally:
             is_solving = False
-    
+
     return new_solutions
 
 
+class SolverHTTPServer(http.server.ThreadingHTTPServer):
+    """
+    Threaded HTTP server so a slow /api/generate does not block static
+    assets or /api/status. The solver_lock still serializes DLX stepping;
+    everything else (cached responses, file serving) runs concurrently.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def server_bind(self):
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except (AttributeError, OSError):
+            pass  # SO_REUSEPORT not available on all platforms
+        super().server_bind()
+
+
 class SolverHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP handler with API endpoints for solution generation."""
-    
+
+    # Keep-alive between requests and no Nagle buffering on small
+    # API responses
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(WEB_DIR), **kwargs)
-    
+
+    def end_headers(self):
+        # Static data and assets are immutable enough to cache client-side
+        path = urlparse(self.path).path
+        if (path.startswith("/data/") and path.endswith(".json")) or \
+                path.startswith("/assets/"):
+            self.send_header("Cache-Control", "public, max-age=3600")
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        """
+        Send static file bodies with os.sendfile when possible.
+
+        The kernel copies straight from the page cache to the socket, so
+        the file bytes never pass through userspace buffers. Falls back to
+        shutil.copyfileobj for anything that is not a plain file-to-socket
+        transfer.
+        """
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            remaining = os.fstat(in_fd).st_size
+        except (AttributeError, OSError, ValueError):
+            shutil.copyfileobj(source, outputfile)
+            return
+
+        # Headers may still sit in the response buffer; order them
+        # before writing to the raw socket fd
+        outputfile.flush()
+
+        offset = 0
+        try:
+            while remaining > 0:
+                sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        except OSError:
+            if offset == 0:
+                # sendfile unsupported for this pair - plain buffered copy
+                shutil.copyfileobj(source, outputfile)
+            else:
+                raise
+
     def do_GET(self):
         parsed = urlparse(self.path)
         
@@ -142,47 +308,65 @@ class SolverHandler(http.server.SimpleHTTPRequestHandler):
     def handle_status(self):
         """Get solver status."""
         response = {
-            "ready": dlx_generator is not None,
+            "ready": dlx_solver is not None,
             "solving": is_solving,
             "total_solutions": len(solution_set) if solution_set else 0
         }
         self.send_json(response)
     
     def handle_get_solutions(self):
-        """Get all current solutions."""
-        if solution_set is None:
-            solutions = []
-        else:
-            solutions = [
-                {
-                    "id": i,
-                    "pieces": [[[x, y, z] for x, y, z in piece] for piece in sol]
-                }
-                for i, sol in enumerate(solution_set.solutions)
-            ]
-        
-        response = {
-            "metadata": {
-                "problem": "6x6x6 cube with T-tetracubes",
-                "cube_size": 6,
-                "total_cells": 216,
-                "pieces_per_solution": 54,
-                "piece_type": "T-tetracube",
-                "cells_per_piece": 4,
-                "symmetry_group": "cube rotations (24 elements)",
-                "total_solutions": len(solutions),
-                "live_generation": True
-            },
-            "solutions": solutions
+        """
+        Get all current solutions.
+
+        Streamed with Transfer-Encoding: chunked - each pre-serialized
+        solution fragment is written as its own chunk, so the response
+        never materializes the full multi-MB payload and the client sees
+        the first bytes immediately.
+        """
+        # Snapshot the blob list, not the solution set: add_batch
+        # publishes a whole batch to the set before the corresponding
+        # blobs are appended, and the blob list is append-only, so this
+        # count is always safe to index from another thread
+        count = len(_solution_blobs)
+
+        metadata = {
+            "problem": "6x6x6 cube with T-tetracubes",
+            "cube_size": 6,
+            "total_cells": 216,
+            "pieces_per_solution": 54,
+            "piece_type": "T-tetracube",
+            "cells_per_piece": 4,
+            "symmetry_group": "cube rotations (24 elements)",
+            "total_solutions": count,
+            "live_generation": True
         }
-        
-        self.send_json(response)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        self.write_chunk(b'{"metadata":' + dumps_bytes(metadata) + b',"solutions":[')
+        for i in range(count):
+            blob = _solution_blobs[i]
+            self.write_chunk(b',' + blob if i else blob)
+        self.write_chunk(b']}')
+        self.end_chunks()
+
+    def write_chunk(self, data: bytes):
+        """Write one chunk in HTTP/1.1 chunked framing."""
+        if data:
+            self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+
+    def end_chunks(self):
+        """Terminate a chunked response."""
+        self.wfile.write(b"0\r\n\r\n")
     
     def handle_get_patterns(self):
         """Get all common piece patterns for learning."""
-        # Pass current solutions so patterns can be extracted from real data
-        solutions = list(solution_set.solutions) if solution_set else []
-        patterns = get_all_patterns(solutions)
+        # Patterns are extracted incrementally and cached by solution count
+        patterns = get_current_patterns()
         response = {
             "success": True,
             "patterns": [
@@ -202,8 +386,8 @@ class SolverHandler(http.server.SimpleHTTPRequestHandler):
     def handle_get_pattern(self, path):
         """Get a specific pattern by ID."""
         pattern_id = path.replace("/api/pattern/", "")
-        solutions = list(solution_set.solutions) if solution_set else []
-        pattern = get_pattern(pattern_id, solutions)
+        version = len(solution_set) if solution_set else 0
+        pattern = get_pattern_by_id(pattern_id, version)
         
         if pattern:
             response = {
@@ -233,27 +417,33 @@ class SolverHandler(http.server.SimpleHTTPRequestHandler):
         if solution_set is None or solution_id >= len(solution_set.solutions):
             self.send_json({"success": False, "error": "Solution not found"})
             return
-        
-        # Get the solution and order it for tutorial
-        solution = solution_set.solutions[solution_id]
-        ordered_pieces = order_solution_for_tutorial(solution)
-        tutorial_steps = generate_tutorial_steps(ordered_pieces)
-        stats = analyze_solution_patterns(ordered_pieces)
-        
-        response = {
-            "success": True,
-            "solution_id": solution_id,
-            "total_pieces": len(ordered_pieces),
-            "statistics": stats,
-            "steps": tutorial_steps,
-            "ordered_pieces": [[[x, y, z] for x, y, z in piece] for piece in ordered_pieces]
-        }
-        
-        self.send_json(response)
+
+        cached = _tutorial_cache.get(solution_id)
+        if cached is None:
+            # Get the solution and order it for tutorial
+            solution = cells_to_coords(solution_set.solutions[solution_id]).tolist()
+            ordered_pieces = order_solution_for_tutorial(solution)
+            tutorial_steps = generate_tutorial_steps(ordered_pieces)
+            stats = analyze_solution_patterns(ordered_pieces)
+
+            response = {
+                "success": True,
+                "solution_id": solution_id,
+                "total_pieces": len(ordered_pieces),
+                "statistics": stats,
+                "steps": tutorial_steps,
+                "ordered_pieces": [[[x, y, z] for x, y, z in piece] for piece in ordered_pieces]
+            }
+            cached = _tutorial_cache[solution_id] = dumps_bytes(response)
+
+        self.send_json_bytes(cached)
     
     def send_json(self, data):
         """Send JSON response."""
-        content = json.dumps(data).encode('utf-8')
+        self.send_json_bytes(dumps_bytes(data))
+
+    def send_json_bytes(self, content: bytes):
+        """Send an already-serialized JSON payload."""
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', len(content))
@@ -284,7 +474,7 @@ def main():
     init_thread = threading.Thread(target=init_solver)
     init_thread.start()
     
-    with socketserver.TCPServer(("", PORT), SolverHandler) as httpd:
+    with SolverHTTPServer(("", PORT), SolverHandler) as httpd:
         print(f"Server running at http://localhost:{PORT}")
         print("Press Ctrl+C to stop")
         try:
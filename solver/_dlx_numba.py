@@ -0,0 +1,199 @@
+"""
+_dlx_numba.py - Numba-compiled kernels for the array-based DLX solver
+
+The flat node-array layout is documented in exact_cover.py; these
+functions are the compiled hot path that ArrayDLX drives. They are kept
+in their own module so the solver imports (and Numba's on-disk cache)
+stay independent of the pure-Python reference implementation.
+"""
+
+import numpy as np
+from numba import njit
+
+
+# Search-state machine codes for the iterative kernel
+_ST_ENTER = 0   # entering a level: choose a column and cover it
+_ST_TRY = 1     # trying the next row of the current column
+_ST_RETURN = 2  # returning from a deeper level: undo the last row choice
+_ST_DONE = 3    # search space exhausted
+
+
+@njit(cache=True, nogil=True)
+def _cover(L, R, U, D, COL, SIZE, c):
+    """
+    Cover column c: unlink it and all rows that have a 1 in it.
+
+    Used for Python-side branch setup (solve_parallel); the search kernel
+    inlines these pointer swaps directly so the hot loop stays call-free.
+    """
+    R[L[c]] = R[c]
+    L[R[c]] = L[c]
+    i = D[c]
+    while i != c:
+        j = R[i]
+        while j != i:
+            D[U[j]] = D[j]
+            U[D[j]] = U[j]
+            SIZE[COL[j]] -= 1
+            j = R[j]
+        i = D[i]
+
+
+@njit(cache=True, nogil=True)
+def _uncover(L, R, U, D, COL, SIZE, c):
+    """Uncover column c: exact inverse of _cover."""
+    i = U[c]
+    while i != c:
+        j = L[i]
+        while j != i:
+            SIZE[COL[j]] += 1
+            D[U[j]] = j
+            U[D[j]] = j
+            j = L[j]
+        i = U[i]
+    R[L[c]] = c
+    L[R[c]] = c
+
+
+@njit(cache=True, nogil=True)
+def _search_batch(L, R, U, D, COL, ROW, SIZE, PRI,
+                  node_stack, col_stack, state,
+                  out_rows, out_lens, max_out):
+    """
+    Resumable iterative Algorithm X over the flat-array DLX matrix.
+
+    Fills up to max_out solutions into out_rows/out_lens and returns how many
+    were found. The explicit stacks plus the (depth, mode) pair in `state`
+    fully capture the search position, so repeated calls continue where the
+    previous one stopped. state[1] == _ST_DONE signals exhaustion.
+
+    PRI holds a static per-column tie-break rank (header-node indexed):
+    among equal-size columns the MRV scan prefers the lowest rank, so the
+    caller can bias the choice toward geometrically constrained cells
+    instead of accepting arbitrary header order. All-zero PRI reproduces
+    the classic first-minimum behavior.
+
+    cover/uncover are inlined at their four sites (as in Knuth's own
+    implementation) so the whole search is one flat loop over the seven
+    arrays with no function calls.
+    """
+    depth = state[0]
+    mode = state[1]
+    n_found = 0
+
+    while True:
+        if mode == _ST_ENTER:
+            if R[0] == 0:
+                # No columns left - the current stack is a complete solution
+                for i in range(depth):
+                    out_rows[n_found, i] = ROW[node_stack[i]]
+                out_lens[n_found] = depth
+                n_found += 1
+                depth -= 1
+                mode = _ST_RETURN
+                if n_found >= max_out:
+                    state[0] = depth
+                    state[1] = mode
+                    return n_found
+                continue
+
+            # Choose column with minimum size (MRV / S heuristic); ties
+            # go to the column with the lowest static priority rank
+            best = R[0]
+            best_size = SIZE[best]
+            c = R[best]
+            while c != 0 and best_size > 0:
+                if SIZE[c] < best_size or \
+                        (SIZE[c] == best_size and PRI[c] < PRI[best]):
+                    best_size = SIZE[c]
+                    best = c
+                c = R[c]
+
+            if best_size == 0:
+                # Dead end - column cannot be covered
+                depth -= 1
+                mode = _ST_RETURN
+                continue
+
+            # Cover `best` (inlined)
+            R[L[best]] = R[best]
+            L[R[best]] = L[best]
+            i = D[best]
+            while i != best:
+                j = R[i]
+                while j != i:
+                    D[U[j]] = D[j]
+                    U[D[j]] = U[j]
+                    SIZE[COL[j]] -= 1
+                    j = R[j]
+                i = D[i]
+
+            col_stack[depth] = best
+            node_stack[depth] = D[best]
+            mode = _ST_TRY
+
+        elif mode == _ST_TRY:
+            r = node_stack[depth]
+            c = col_stack[depth]
+            if r == c:
+                # All rows of this column tried - uncover c (inlined)
+                # and backtrack
+                i = U[c]
+                while i != c:
+                    j = L[i]
+                    while j != i:
+                        SIZE[COL[j]] += 1
+                        D[U[j]] = j
+                        U[D[j]] = j
+                        j = L[j]
+                    i = U[i]
+                R[L[c]] = c
+                L[R[c]] = c
+
+                depth -= 1
+                mode = _ST_RETURN
+                continue
+            # Cover all other columns this row touches (inlined), then descend
+            j = R[r]
+            while j != r:
+                c2 = COL[j]
+                R[L[c2]] = R[c2]
+                L[R[c2]] = L[c2]
+                i = D[c2]
+                while i != c2:
+                    j2 = R[i]
+                    while j2 != i:
+                        D[U[j2]] = D[j2]
+                        U[D[j2]] = U[j2]
+                        SIZE[COL[j2]] -= 1
+                        j2 = R[j2]
+                    i = D[i]
+                j = R[j]
+            depth += 1
+            mode = _ST_ENTER
+
+        else:  # _ST_RETURN
+            if depth < 0:
+                state[0] = depth
+                state[1] = _ST_DONE
+                return n_found
+            # Undo the row choice at this level (uncover inlined, in
+            # reverse order) and advance to the next row
+            r = node_stack[depth]
+            j = L[r]
+            while j != r:
+                c2 = COL[j]
+                i = U[c2]
+                while i != c2:
+                    j2 = L[i]
+                    while j2 != i:
+                        SIZE[COL[j2]] += 1
+                        D[U[j2]] = j2
+                        U[D[j2]] = j2
+                        j2 = L[j2]
+                    i = U[i]
+                R[L[c2]] = c2
+                L[R[c2]] = c2
+                j = L[j]
+            node_stack[depth] = D[r]
+            mode = _ST_TRY
@@ -21,235 +21,365 @@ implement the "covering" and "uncovering" operations. Each column and row
 can be removed and restored in O(1) time.
 
 Reference: Donald Knuth, "Dancing Links" (2000)
+
+Implementation Notes:
+Both implementations store the sparse matrix as flat int32 arrays
+(L, R, U, D, COL, ROW, SIZE) indexed by node id - every link traversal is
+a contiguous array load rather than a pointer chase through heap-scattered
+objects. DancingLinks keeps the recursion in readable pure Python; the hot
+path used by the solver is ArrayDLX, whose search runs in a Numba-compiled
+kernel that emits solutions in batches.
 """
 
-from typing import List, Optional, Generator, Callable
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from numba import njit
+
+from ._dlx_numba import (
+    _ST_ENTER,
+    _ST_TRY,
+    _ST_RETURN,
+    _ST_DONE,
+    _cover,
+    _uncover,
+    _search_batch,
+)
+from typing import Any, Callable, Dict, Generator, List, Optional
 
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
-
-class Node:
-    """
-    A node in the Dancing Links sparse matrix.
-    
-    Each node represents a 1 in the binary matrix.
-    Nodes are linked in both directions (left/right within a row,
-    up/down within a column).
-    """
-    __slots__ = ['left', 'right', 'up', 'down', 'column', 'row_id']
-    
-    def __init__(self):
-        self.left: 'Node' = None
-        self.right: 'Node' = None
-        self.up: 'Node' = None
-        self.down: 'Node' = None
-        self.column: 'ColumnNode' = None
-        self.row_id: int = -1  # Which row (placement) this node belongs to
+#
+# Node layout shared by DancingLinks and ArrayDLX (all arrays int32,
+# indexed by node id):
+#   node 0            : header
+#   nodes 1..C        : column headers (column i -> node i+1)
+#   nodes C+1..       : one node per 1 in the matrix, allocated row-major
+#
+#   L, R, U, D : left/right/up/down links (node ids)
+#   COL        : owning column-header node id
+#   ROW        : row identifier (row nodes only; -1 for headers)
+#   SIZE       : number of 1s per column, indexed by column-header node id
 
 
-class ColumnNode(Node):
+def _fixed_width_ops_source(width: int) -> str:
     """
-    A column header node.
-    
-    Contains additional information:
-    - size: number of 1s in this column (used for heuristic column selection)
-    - name: column identifier (cell index for our problem)
+    Emit cover/uncover source specialized for rows of a fixed width.
+
+    Horizontal links are never modified during the search, so when every
+    row has exactly `width` nodes each ring walk visits width-1 others -
+    the `while j != i` loop can be unrolled into straight-line code with
+    no per-step termination test. For this problem width is always 4.
     """
-    __slots__ = ['size', 'name']
-    
-    def __init__(self):
-        super().__init__()
-        self.size: int = 0
-        self.name: int = -1
+    unlink = (
+        "        D[U[j]] = D[j]\n"
+        "        U[D[j]] = U[j]\n"
+        "        cj = int(COL[j])\n"
+        "        SIZE[cj] -= 1\n"
+        "        move(cj, SIZE[cj] + 1, SIZE[cj])\n"
+        "        j = R[j]\n"
+    ) * (width - 1)
+    relink = (
+        "        cj = int(COL[j])\n"
+        "        SIZE[cj] += 1\n"
+        "        move(cj, SIZE[cj] - 1, SIZE[cj])\n"
+        "        D[U[j]] = j\n"
+        "        U[D[j]] = j\n"
+        "        j = L[j]\n"
+    ) * (width - 1)
+
+    return (
+        "def cover(self, c):\n"
+        f"    \"\"\"cover() unrolled for width-{width} rows (generated).\"\"\"\n"
+        "    L, R, U, D = self.L, self.R, self.U, self.D\n"
+        "    COL, SIZE = self.COL, self.SIZE\n"
+        "    move = self._move_bucket\n"
+        "    R[L[c]] = R[c]\n"
+        "    L[R[c]] = L[c]\n"
+        "    self.cols_by_size[SIZE[c]].discard(c)\n"
+        "    i = D[c]\n"
+        "    while i != c:\n"
+        "        j = R[i]\n"
+        f"{unlink}"
+        "        i = D[i]\n"
+        "\n"
+        "def uncover(self, c):\n"
+        f"    \"\"\"uncover() unrolled for width-{width} rows (generated).\"\"\"\n"
+        "    L, R, U, D = self.L, self.R, self.U, self.D\n"
+        "    COL, SIZE = self.COL, self.SIZE\n"
+        "    move = self._move_bucket\n"
+        "    i = U[c]\n"
+        "    while i != c:\n"
+        "        j = L[i]\n"
+        f"{relink}"
+        "        i = U[i]\n"
+        "    R[L[c]] = c\n"
+        "    L[R[c]] = c\n"
+        "    self.cols_by_size[SIZE[c]].add(c)\n"
+    )
 
 
 class DancingLinks:
     """
-    Dancing Links matrix implementation.
-    
-    The matrix is represented as a torus of doubly-linked nodes.
-    The header node is the entry point for traversing columns.
+    Dancing Links matrix over flat int32 arrays (pure Python).
+
+    The matrix is a torus of doubly-linked node ids: following a link is
+    one contiguous array load (L[i], R[i], ...) instead of an attribute
+    dereference on a heap-allocated node object, so the cover/uncover
+    inner loops stay cache-friendly even without compilation.
     """
-    
-    def __init__(self, num_columns: int):
+
+    # Node capacity grows by doubling from here as rows are added
+    _INITIAL_CAPACITY = 4096
+
+    def __init__(self, num_columns: int,
+                 column_priority: Optional[np.ndarray] = None):
         """
         Initialize the DLX matrix with the given number of columns.
-        
+
         Args:
-            num_columns: Number of columns (216 for our 6×6×6 cube)
-        """
-        self.header = ColumnNode()
-        self.header.left = self.header
-        self.header.right = self.header
-        self.header.up = self.header
-        self.header.down = self.header
-        self.header.column = self.header
-        self.header.name = -1
-        
-        # Create column headers
-        self.columns: List[ColumnNode] = []
-        prev = self.header
-        
-        for i in range(num_columns):
-            col = ColumnNode()
-            col.name = i
-            col.size = 0
-            col.column = col
-            col.up = col
-            col.down = col
-            
-            # Link horizontally
-            col.left = prev
-            col.right = self.header
-            prev.right = col
-            self.header.left = col
-            
-            self.columns.append(col)
-            prev = col
-        
+            num_columns: Number of columns (216 for our 6x6x6 cube)
+            column_priority: Optional per-column rank for breaking MRV
+                ties (lower rank wins); None picks arbitrarily within
+                the minimal-size bucket
+        """
+        self.num_columns = num_columns
+        self.column_priority = column_priority
+        capacity = max(self._INITIAL_CAPACITY, num_columns + 1)
+
+        self.L = np.empty(capacity, dtype=np.int32)
+        self.R = np.empty(capacity, dtype=np.int32)
+        self.U = np.empty(capacity, dtype=np.int32)
+        self.D = np.empty(capacity, dtype=np.int32)
+        self.COL = np.empty(capacity, dtype=np.int32)
+        self.ROW = np.full(capacity, -1, dtype=np.int32)
+        self.SIZE = np.zeros(capacity, dtype=np.int32)
+
+        # Header ring: header (0) <-> column headers (1..C)
+        C = num_columns
+        for i in range(C + 1):
+            self.L[i] = i - 1 if i > 0 else C
+            self.R[i] = i + 1 if i < C else 0
+            self.U[i] = i
+            self.D[i] = i
+            self.COL[i] = i
+
+        self.n_nodes = C + 1
         self.num_rows = 0
         self.solution_rows: List[int] = []
-    
+
+        # MRV buckets: cols_by_size[k] holds the active column-header node
+        # ids whose current size is k. Kept in sync by add_row/cover/uncover
+        # so choose_column is O(min_size) instead of a full header-ring scan.
+        self.cols_by_size: List[set] = [set(range(1, C + 1))]
+
+        # Common row width across all added rows (None once widths differ);
+        # solve() specializes cover/uncover for it via runtime codegen
+        self._uniform_width: Optional[int] = None
+        self._specialized = False
+
+    def _move_bucket(self, c: int, old_size: int, new_size: int) -> None:
+        """Move column c between MRV buckets after a size change."""
+        self.cols_by_size[old_size].discard(c)
+        while len(self.cols_by_size) <= new_size:
+            self.cols_by_size.append(set())
+        self.cols_by_size[new_size].add(c)
+
+    def _grow(self, needed: int) -> None:
+        """Double the node arrays until they can hold `needed` nodes."""
+        capacity = len(self.L)
+        while capacity < needed:
+            capacity *= 2
+        for name in ('L', 'R', 'U', 'D', 'COL', 'ROW', 'SIZE'):
+            old = getattr(self, name)
+            fill = -1 if name == 'ROW' else 0
+            grown = np.full(capacity, fill, dtype=np.int32)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
     def add_row(self, row_id: int, column_indices: List[int]) -> None:
         """
         Add a row to the matrix.
-        
+
+        The row's nodes get consecutive ids, so horizontal traversal in
+        cover/uncover is a stride-1 walk.
+
         Args:
             row_id: Identifier for this row (placement index)
             column_indices: List of column indices where this row has 1s
         """
         if not column_indices:
             return
-        
-        first_node = None
-        prev_node = None
-        
-        for col_idx in column_indices:
-            col = self.columns[col_idx]
-            
-            # Create new node
-            node = Node()
-            node.row_id = row_id
-            node.column = col
-            
-            # Link vertically (at bottom of column)
-            node.up = col.up
-            node.down = col
-            col.up.down = node
-            col.up = node
-            
-            # Update column size
-            col.size += 1
-            
-            # Link horizontally (circular list)
-            if first_node is None:
-                first_node = node
-                node.left = node
-                node.right = node
+
+        if self.num_rows == 0:
+            self._uniform_width = len(column_indices)
+        elif self._uniform_width != len(column_indices):
+            self._uniform_width = None
+
+        base = self.n_nodes
+        if base + len(column_indices) > len(self.L):
+            self._grow(base + len(column_indices))
+
+        L, R, U, D = self.L, self.R, self.U, self.D
+        COL, ROW, SIZE = self.COL, self.ROW, self.SIZE
+
+        for k, col_idx in enumerate(column_indices):
+            node = base + k
+            c = col_idx + 1  # column-header node id
+
+            # Vertical: append at the bottom of the column
+            U[node] = U[c]
+            D[node] = c
+            D[U[c]] = node
+            U[c] = node
+            SIZE[c] += 1
+            self._move_bucket(c, SIZE[c] - 1, SIZE[c])
+            COL[node] = c
+            ROW[node] = row_id
+
+            # Horizontal: circular within the row
+            if k == 0:
+                L[node] = node
+                R[node] = node
             else:
-                node.left = prev_node
-                node.right = first_node
-                prev_node.right = node
-                first_node.left = node
-            
-            prev_node = node
-        
+                L[node] = node - 1
+                R[node] = base
+                R[node - 1] = node
+                L[base] = node
+
+        self.n_nodes = base + len(column_indices)
         self.num_rows += 1
-    
-    def choose_column(self) -> Optional[ColumnNode]:
+
+    def choose_column(self) -> Optional[int]:
         """
         Choose a column to cover using the "minimum remaining values" heuristic.
-        
+
         This heuristic (also known as "S heuristic" in Knuth's paper) selects
         the column with the fewest 1s, which minimizes branching factor.
-        
+
+        Implemented over the MRV buckets: scan cols_by_size from k=0
+        upward and return any column in the first nonempty bucket, which
+        costs O(min_size) instead of walking every active column.
+
         Returns:
-            Column with minimum size, or None if all columns are covered
+            Column-header node id with minimum size, or None if all columns
+            are covered
         """
-        if self.header.right is self.header:
+        if self.R[0] == 0:
             return None  # All columns covered - solution found!
-        
-        min_size = float('inf')
-        min_col = None
-        
-        col = self.header.right
-        while col is not self.header:
-            if col.size < min_size:
-                min_size = col.size
-                min_col = col
-                if min_size == 0:
-                    break  # Can't do better than 0 (dead end)
-            col = col.right
-        
-        return min_col
-    
-    def cover(self, col: ColumnNode) -> None:
+
+        for bucket in self.cols_by_size:
+            if bucket:
+                if self.column_priority is None:
+                    return next(iter(bucket))
+                # Tie-break within the minimal bucket by geometric rank
+                # (column-header node id c maps to column index c - 1)
+                return min(bucket, key=lambda c: self.column_priority[c - 1])
+
+        return None  # Unreachable while the header ring is nonempty
+
+    def cover(self, c: int) -> None:
         """
         Cover a column (remove it from the header list and remove all rows
         that have a 1 in this column from other columns they're in).
-        
+
         This is the key operation that makes Algorithm X work.
         """
-        # Remove column from header list
-        col.right.left = col.left
-        col.left.right = col.right
-        
-        # For each row in this column
-        row = col.down
-        while row is not col:
-            # Remove this row from all other columns
-            node = row.right
-            while node is not row:
-                node.down.up = node.up
-                node.up.down = node.down
-                node.column.size -= 1
-                node = node.right
-            row = row.down
-    
-    def uncover(self, col: ColumnNode) -> None:
+        L, R, U, D = self.L, self.R, self.U, self.D
+        COL, SIZE = self.COL, self.SIZE
+
+        # Remove column from header ring (and from the MRV buckets, so
+        # choose_column never considers a covered column)
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        self.cols_by_size[SIZE[c]].discard(c)
+
+        # For each row in this column, unlink the row from other columns
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                cj = int(COL[j])
+                SIZE[cj] -= 1
+                self._move_bucket(cj, SIZE[cj] + 1, SIZE[cj])
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, c: int) -> None:
         """
         Uncover a column (restore it - the "dancing" part of Dancing Links).
-        
+
         This operation reverses cover() exactly, which is possible because
         we never actually delete nodes - we just modify their links.
         """
-        # For each row in this column (in reverse order)
-        row = col.up
-        while row is not col:
-            # Restore this row in all other columns
-            node = row.left
-            while node is not row:
-                node.column.size += 1
-                node.down.up = node
-                node.up.down = node
-                node = node.left
-            row = row.up
-        
-        # Restore column in header list
-        col.right.left = col
-        col.left.right = col
-    
-    def solve(self, callback: Callable[[List[int]], bool] = None) -> Generator[List[int], None, None]:
+        L, R, U, D = self.L, self.R, self.U, self.D
+        COL, SIZE = self.COL, self.SIZE
+
+        # For each row in this column (in reverse order), relink the row
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                cj = int(COL[j])
+                SIZE[cj] += 1
+                self._move_bucket(cj, SIZE[cj] - 1, SIZE[cj])
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+
+        # Restore column in header ring and in the MRV buckets
+        R[L[c]] = c
+        L[R[c]] = c
+        self.cols_by_size[SIZE[c]].add(c)
+
+    def solve(self, callback: Callable[[List[int]], bool] = None,
+              copy_solutions: bool = True) -> Generator[List[int], None, None]:
         """
         Solve the exact cover problem using Algorithm X.
-        
+
         Yields all solutions as lists of row IDs.
-        
+
         Args:
             callback: Optional callback function that receives each solution.
                      If callback returns True, stop searching.
-        
+            copy_solutions: If True (default), each solution is yielded as
+                     a fresh list. If False, the solver's live
+                     solution_rows list is yielded directly - one fewer
+                     allocation and GC item per solution on enumerate-all
+                     runs, but the list is reused across solutions, so
+                     callers that retain it must copy.
+
         Yields:
             Lists of row IDs that form complete solutions
         """
-        yield from self._solve_recursive(callback)
-    
-    def _solve_recursive(self, callback: Callable[[List[int]], bool] = None) -> Generator[List[int], None, None]:
+        if self._uniform_width is not None and not self._specialized:
+            self._specialize(self._uniform_width)
+        yield from self._solve_recursive(callback, copy_solutions)
+
+    def _specialize(self, width: int) -> None:
+        """
+        Install cover/uncover variants unrolled for the uniform row width.
+
+        The specialized source is generated and compiled once per matrix;
+        the bound methods shadow the generic class implementations.
+        """
+        namespace: Dict[str, Any] = {}
+        source = _fixed_width_ops_source(width)
+        exec(compile(source, f"<dlx cover/uncover width={width}>", "exec"), namespace)
+        self.cover = namespace["cover"].__get__(self)
+        self.uncover = namespace["uncover"].__get__(self)
+        self._specialized = True
+
+    def _solve_recursive(self, callback: Callable[[List[int]], bool] = None,
+                         copy_solutions: bool = True) -> Generator[List[int], None, None]:
         """
         Recursive implementation of Algorithm X.
-        
+
         Mathematical correctness:
         1. If no columns remain, we've found a solution
         2. Otherwise, choose a column c (heuristically, the smallest)
@@ -260,83 +390,670 @@ class DancingLinks:
            d. Uncover all columns covered by r (backtrack)
         """
         # Choose column with minimum size (MRV heuristic)
-        col = self.choose_column()
-        
-        if col is None:
+        c = self.choose_column()
+
+        if c is None:
             # All columns covered - found a solution!
-            solution = list(self.solution_rows)
+            solution = list(self.solution_rows) if copy_solutions \
+                else self.solution_rows
             if callback is not None:
                 if callback(solution):
                     return  # Stop if callback returns True
             yield solution
             return
-        
-        if col.size == 0:
+
+        if self.SIZE[c] == 0:
             # Dead end - this column can't be covered
             return
-        
+
+        L, R, D, ROW, COL = self.L, self.R, self.D, self.ROW, self.COL
+
         # Cover this column
-        self.cover(col)
-        
+        self.cover(c)
+
         # Try each row in this column
-        row = col.down
-        while row is not col:
+        r = D[c]
+        while r != c:
             # Include this row in the solution
-            self.solution_rows.append(row.row_id)
-            
+            self.solution_rows.append(int(ROW[r]))
+
             # Cover all other columns this row touches
-            node = row.right
-            while node is not row:
-                self.cover(node.column)
-                node = node.right
-            
+            j = R[r]
+            while j != r:
+                self.cover(COL[j])
+                j = R[j]
+
             # Recurse
-            yield from self._solve_recursive(callback)
-            
+            yield from self._solve_recursive(callback, copy_solutions)
+
             # Backtrack: uncover columns (in reverse order)
-            node = row.left
-            while node is not row:
-                self.uncover(node.column)
-                node = node.left
-            
+            j = L[r]
+            while j != r:
+                self.uncover(COL[j])
+                j = L[j]
+
             # Remove this row from solution
             self.solution_rows.pop()
-            
-            row = row.down
-        
+
+            r = D[r]
+
         # Uncover the column
-        self.uncover(col)
+        self.uncover(c)
+
+
+# =============================================================================
+# ARRAY-BASED DLX (NUMBA KERNEL)
+# =============================================================================
+#
+# The compiled cover/uncover/search kernels live in _dlx_numba; ArrayDLX
+# below owns the arrays and the resumable search state and drives them.
+
+
+@njit(cache=True)
+def _fill_row_nodes(rows, row_ids, start, L, R, U, D, COL, ROW, SIZE):
+    """
+    Write the node arrays for a (num_rows, width) block of rows.
+
+    Same link-building as the per-row Python loop in _build_arrays, but
+    over a contiguous int32 array in compiled nested loops - build cost
+    becomes proportional to raw memory writes.
+    """
+    node = start
+    n_rows, width = rows.shape
+    for r in range(n_rows):
+        first = node
+        for k in range(width):
+            c = rows[r, k] + 1  # column-header node id
+            # Vertical: append at the bottom of the column
+            U[node] = U[c]
+            D[node] = c
+            D[U[c]] = node
+            U[c] = node
+            SIZE[c] += 1
+            COL[node] = c
+            ROW[node] = row_ids[r]
+            # Horizontal: circular within the row
+            if k == 0:
+                L[node] = node
+                R[node] = node
+            else:
+                L[node] = node - 1
+                R[node] = first
+                R[node - 1] = node
+                L[first] = node
+            node += 1
+
+
+class ArrayDLX:
+    """
+    Flat-array Dancing Links matrix with a Numba-compiled search kernel.
+
+    Drop-in replacement for DancingLinks on the hot path: same add_row /
+    solve generator interface, but link traversal happens on contiguous
+    int32 arrays inside compiled code instead of Python object attributes.
+    """
+
+    def __init__(self, num_columns: int,
+                 column_priority: Optional[np.ndarray] = None):
+        """
+        Args:
+            num_columns: Number of columns in the matrix
+            column_priority: Optional per-column rank (length num_columns)
+                used to break MRV ties - lower rank wins. For the cube
+                this is CELL_PRIORITY (corners before center cells),
+                which shrinks the backtrack tree versus arbitrary header
+                order. None keeps the classic first-minimum choice.
+        """
+        self.num_columns = num_columns
+        self.column_priority = column_priority
+        self.rows: List[List[int]] = []       # column indices per row
+        self.row_ids: List[int] = []
+        # Bulk-queued (rows_array, row_ids) blocks, appended after the
+        # individually added rows at build time
+        self._bulk: List[tuple] = []
+        self.num_rows = 0
+        self._built = False
+
+    def add_row(self, row_id: int, column_indices: List[int]) -> None:
+        """
+        Queue a row for the matrix (arrays are built lazily on solve).
+
+        A list argument is stored as-is rather than defensively copied -
+        the matrix takes ownership, so callers must not mutate it after
+        adding. Tuples and other iterables are materialized once.
+        """
+        if type(column_indices) is not list:
+            column_indices = list(column_indices)
+        if not column_indices:
+            return
+        self.rows.append(column_indices)
+        self.row_ids.append(row_id)
+        self.num_rows += 1
+
+    def add_rows_bulk(self, rows_array: np.ndarray,
+                      row_ids: Optional[np.ndarray] = None) -> None:
+        """
+        Queue a whole (num_rows, width) block of uniform-width rows at once.
+
+        Equivalent to one add_row call per row, but at build time the
+        block's nodes are written by the compiled _fill_row_nodes loop
+        instead of a per-element Python loop, so no Python list is
+        allocated per row and no per-element interpretation happens.
+
+        Args:
+            rows_array: 2D array of column indices, one row per matrix row
+            row_ids: Row identifiers (default: consecutive ids continuing
+                from the current row count)
+        """
+        rows_array = np.ascontiguousarray(rows_array, dtype=np.int32)
+        if rows_array.size == 0:
+            return
+        if row_ids is None:
+            row_ids = np.arange(self.num_rows,
+                                self.num_rows + len(rows_array), dtype=np.int32)
+        else:
+            row_ids = np.ascontiguousarray(row_ids, dtype=np.int32)
+        self._bulk.append((rows_array, row_ids))
+        self.num_rows += len(rows_array)
+
+    def _build_arrays(self):
+        """Materialize fresh (uncovered) flat node arrays from the queued rows."""
+        C = self.num_columns
+        n_nodes = (1 + C + sum(len(r) for r in self.rows)
+                   + sum(arr.size for arr, _ in self._bulk))
+
+        L = np.empty(n_nodes, dtype=np.int32)
+        R = np.empty(n_nodes, dtype=np.int32)
+        U = np.empty(n_nodes, dtype=np.int32)
+        D = np.empty(n_nodes, dtype=np.int32)
+        COL = np.empty(n_nodes, dtype=np.int32)
+        ROW = np.full(n_nodes, -1, dtype=np.int32)
+        SIZE = np.zeros(n_nodes, dtype=np.int32)
+
+        # Header ring: header (0) <-> column headers (1..C)
+        for i in range(C + 1):
+            L[i] = i - 1 if i > 0 else C
+            R[i] = i + 1 if i < C else 0
+            U[i] = i
+            D[i] = i
+            COL[i] = i
+
+        # Row nodes, allocated row-major so each row is contiguous. Every
+        # T-piece row has exactly 4 nodes, so a row's whole left/right ring
+        # (4 int32 entries per link array) sits inside a single 64-byte
+        # cache line and horizontal traversal in cover/uncover is a
+        # stride-1 walk the hardware prefetcher handles for free.
+        node = C + 1
+        for row_id, cols in zip(self.row_ids, self.rows):
+            first = node
+            for k, col_idx in enumerate(cols):
+                c = col_idx + 1  # column-header node id
+                # Vertical: append at the bottom of the column
+                U[node] = U[c]
+                D[node] = c
+                D[U[c]] = node
+                U[c] = node
+                SIZE[c] += 1
+                COL[node] = c
+                ROW[node] = row_id
+                # Horizontal: circular within the row
+                if k == 0:
+                    L[node] = node
+                    R[node] = node
+                else:
+                    L[node] = node - 1
+                    R[node] = first
+                    R[node - 1] = node
+                    L[first] = node
+                node += 1
+
+        # Bulk blocks: compiled fill over contiguous int32 rows
+        for arr, ids in self._bulk:
+            _fill_row_nodes(arr, ids, node, L, R, U, D, COL, ROW, SIZE)
+            node += arr.size
+
+        return L, R, U, D, COL, ROW, SIZE
+
+    def _priority_array(self) -> np.ndarray:
+        """Tie-break ranks indexed by column-header node id (0 = header)."""
+        pri = np.zeros(self.num_columns + 1, dtype=np.int32)
+        if self.column_priority is not None:
+            pri[1:] = self.column_priority
+        return pri
+
+    def _build(self) -> None:
+        """Build the node arrays and the resumable search state."""
+        arrays = self._build_arrays()
+        self.L, self.R, self.U, self.D = arrays[:4]
+        self.COL, self.ROW, self.SIZE = arrays[4:]
+        self.PRI = self._priority_array()
+
+        # Search state: explicit stacks plus (depth, mode)
+        max_depth = self.num_columns + 1
+        self._node_stack = np.zeros(max_depth, dtype=np.int32)
+        self._col_stack = np.zeros(max_depth, dtype=np.int32)
+        self._state = np.array([0, _ST_ENTER], dtype=np.int32)
+        self._built = True
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the entire search space has been explored."""
+        return self._built and self._state[1] == _ST_DONE
+
+    def reset(self) -> None:
+        """
+        Rewind the search to the start without re-queuing rows.
+
+        The queued rows and bulk blocks are kept, so only the node
+        arrays and the resumable search state are re-materialized - the
+        compiled bulk fill makes this far cheaper than constructing and
+        loading a fresh matrix. Lets one instance serve repeated
+        solve()/solve_batch() runs over the same matrix.
+        """
+        self._build()
+
+    def solve(self, callback: Callable[[List[int]], bool] = None,
+              batch_size: int = 64) -> Generator[List[int], None, None]:
+        """
+        Solve the exact cover problem, yielding solutions as row-id lists.
+
+        The kernel produces solutions in batches of `batch_size` to amortize
+        the Python <-> native transition; the generator then yields them
+        one at a time to preserve the DancingLinks.solve contract.
+        """
+        if not self._built:
+            self._build()
+
+        out_rows = np.empty((batch_size, self.num_columns), dtype=np.int32)
+        out_lens = np.empty(batch_size, dtype=np.int32)
+
+        while not self.exhausted:
+            n = _search_batch(
+                self.L, self.R, self.U, self.D, self.COL, self.ROW, self.SIZE,
+                self.PRI, self._node_stack, self._col_stack, self._state,
+                out_rows, out_lens, batch_size
+            )
+            for i in range(n):
+                solution = out_rows[i, :out_lens[i]].tolist()
+                if callback is not None:
+                    if callback(solution):
+                        return
+                yield solution
+
+    def solve_batch(self, max_count: int) -> List[List[int]]:
+        """
+        Pull up to max_count solutions in a single kernel call.
+
+        Unlike solve(), this re-enters Python once per batch instead of
+        once per solution. The search resumes where the previous call
+        (or generator) stopped; an empty list means exhaustion.
+        """
+        if not self._built:
+            self._build()
+        if self.exhausted:
+            return []
+
+        out_rows = np.empty((max_count, self.num_columns), dtype=np.int32)
+        out_lens = np.empty(max_count, dtype=np.int32)
+
+        n = _search_batch(
+            self.L, self.R, self.U, self.D, self.COL, self.ROW, self.SIZE,
+            self.PRI, self._node_stack, self._col_stack, self._state,
+            out_rows, out_lens, max_count
+        )
+        return [out_rows[i, :out_lens[i]].tolist() for i in range(n)]
+
+    def solve_parallel(self, num_workers: Optional[int] = None,
+                       batch_size: int = 256) -> List[List[int]]:
+        """
+        Enumerate ALL solutions by fanning the root branches across threads.
+
+        Every solution must cover the root MRV column through exactly one of
+        its candidate rows, so the search tree partitions cleanly at depth 1:
+        one independent subtree per candidate. Each worker gets a private
+        copy of the node arrays (~60KB), pre-covers the root column and its
+        branch row, then runs the nogil kernel to exhaustion - no locking on
+        the link structure, and the GIL is released inside the kernel so the
+        threads genuinely run in parallel.
+
+        Independent of the resumable solve()/solve_batch() state: this
+        always searches the full space from scratch. Intended for full
+        enumeration runs, not for incremental generation.
+
+        Args:
+            num_workers: Thread count (default: os.cpu_count())
+            batch_size: Solutions pulled per kernel call within a worker
+
+        Returns:
+            All solutions as row-id lists
+        """
+        L, R, U, D, COL, ROW, SIZE = self._build_arrays()
+        PRI = self._priority_array()
+
+        if R[0] == 0:
+            return [[]]  # No columns: the empty selection is the solution
+
+        # Root column: MRV with priority tie-break, matching the kernel
+        best = R[0]
+        c = R[best]
+        while c != 0:
+            if SIZE[c] < SIZE[best] or \
+                    (SIZE[c] == SIZE[best] and PRI[c] < PRI[best]):
+                best = c
+            c = R[c]
+        if SIZE[best] == 0:
+            return []
+
+        branch_nodes = []
+        i = D[best]
+        while i != best:
+            branch_nodes.append(int(i))
+            i = D[i]
+
+        def run_branch(r: int) -> List[List[int]]:
+            l, rr, u, d = L.copy(), R.copy(), U.copy(), D.copy()
+            col, row, size = COL.copy(), ROW.copy(), SIZE.copy()
+
+            # Commit this branch: cover the root column, then every other
+            # column of the chosen row (same order as the kernel's TRY step)
+            _cover(l, rr, u, d, col, size, best)
+            j = rr[r]
+            while j != r:
+                _cover(l, rr, u, d, col, size, col[j])
+                j = rr[j]
+
+            max_depth = self.num_columns + 1
+            node_stack = np.zeros(max_depth, dtype=np.int32)
+            col_stack = np.zeros(max_depth, dtype=np.int32)
+            state = np.array([0, _ST_ENTER], dtype=np.int32)
+            out_rows = np.empty((batch_size, self.num_columns), dtype=np.int32)
+            out_lens = np.empty(batch_size, dtype=np.int32)
+
+            prefix = int(row[r])
+            found = []
+            while state[1] != _ST_DONE:
+                n = _search_batch(
+                    l, rr, u, d, col, row, size, PRI,
+                    node_stack, col_stack, state,
+                    out_rows, out_lens, batch_size
+                )
+                for i in range(n):
+                    found.append([prefix] + out_rows[i, :out_lens[i]].tolist())
+            return found
+
+        workers = num_workers if num_workers is not None else (os.cpu_count() or 1)
+        solutions: List[List[int]] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for branch_solutions in executor.map(run_branch, branch_nodes):
+                solutions.extend(branch_solutions)
+        return solutions
+
+
+# =============================================================================
+# BITMASK EXACT COVER (NUMBA KERNEL)
+# =============================================================================
+#
+# For boards with <= 256 cells every row fits in four uint64 lanes, so the
+# exact cover state collapses to pure integer bit arithmetic:
+#   - covered: uint64[4]  - bits of cells already covered
+#   - masks:   uint64[R,4] - one 4-lane bitmask per row
+# Covering a row is four XORs; the collision test is four ANDs. This trades
+# DLX's incremental column sizes for brute-force candidate counting, but
+# every operation is a native SIMD-friendly word op.
+
+_BM_WORDS = 4  # 4 x 64 = 256 bits >= 216 cells
+
+
+@njit(cache=True)
+def _bm_collides(masks, covered, r):
+    """True if row r overlaps any already-covered cell."""
+    for w in range(_BM_WORDS):
+        if masks[r, w] & covered[w]:
+            return True
+    return False
+
+
+@njit(cache=True)
+def _bm_search_batch(masks, cell_ptr, cell_rows, covered, full,
+                     stk_cell, stk_k, stk_row, state,
+                     out_rows, out_lens, max_out):
+    """
+    Resumable iterative bitmask exact-cover search.
+
+    Same state-machine shape as _search_batch, but the matrix state is the
+    4-word `covered` bitmask instead of dancing links. stk_k[d] holds the
+    next candidate index (into cell_rows) to try at depth d.
+    """
+    depth = state[0]
+    mode = state[1]
+    n_found = 0
+
+    while True:
+        if mode == _ST_ENTER:
+            done = True
+            for w in range(_BM_WORDS):
+                if covered[w] != full[w]:
+                    done = False
+                    break
+            if done:
+                for i in range(depth):
+                    out_rows[n_found, i] = stk_row[i]
+                out_lens[n_found] = depth
+                n_found += 1
+                depth -= 1
+                mode = _ST_RETURN
+                if n_found >= max_out:
+                    state[0] = depth
+                    state[1] = mode
+                    return n_found
+                continue
+
+            # MRV: uncovered cell with the fewest non-colliding candidates
+            best_cell = -1
+            best_count = 0x7FFFFFFF
+            for cell in range(cell_ptr.shape[0] - 1):
+                w = cell >> 6
+                if covered[w] & (np.uint64(1) << np.uint64(cell & 63)):
+                    continue
+                count = 0
+                for k in range(cell_ptr[cell], cell_ptr[cell + 1]):
+                    if not _bm_collides(masks, covered, cell_rows[k]):
+                        count += 1
+                        if count >= best_count:
+                            break
+                if count < best_count:
+                    best_count = count
+                    best_cell = cell
+                    if best_count <= 1:
+                        break
+
+            if best_count == 0:
+                depth -= 1
+                mode = _ST_RETURN
+                continue
+
+            stk_cell[depth] = best_cell
+            stk_k[depth] = cell_ptr[best_cell]
+            mode = _ST_TRY
+
+        elif mode == _ST_TRY:
+            cell = stk_cell[depth]
+            k = stk_k[depth]
+            end = cell_ptr[cell + 1]
+            r = -1
+            while k < end:
+                cand = cell_rows[k]
+                k += 1
+                if not _bm_collides(masks, covered, cand):
+                    r = cand
+                    break
+            if r < 0:
+                depth -= 1
+                mode = _ST_RETURN
+                continue
+            stk_k[depth] = k
+            stk_row[depth] = r
+            for w in range(_BM_WORDS):
+                covered[w] ^= masks[r, w]
+            depth += 1
+            mode = _ST_ENTER
+
+        else:  # _ST_RETURN
+            if depth < 0:
+                state[0] = depth
+                state[1] = _ST_DONE
+                return n_found
+            r = stk_row[depth]
+            for w in range(_BM_WORDS):
+                covered[w] ^= masks[r, w]
+            mode = _ST_TRY
+
+
+class BitmaskExactCover:
+    """
+    Bitmask-based exact cover solver for problems with <= 256 columns.
+
+    Same add_row / solve interface as ArrayDLX, but rows are stored as
+    4-lane uint64 bitmasks and the search state is a single covered-bits
+    vector. Kept as an alternative backend to the DLX kernel; DLX remains
+    the default pending benchmarking on the full enumeration workload.
+    """
+
+    def __init__(self, num_columns: int):
+        if num_columns > 64 * _BM_WORDS:
+            raise ValueError(
+                f"BitmaskExactCover supports at most {64 * _BM_WORDS} columns, "
+                f"got {num_columns}"
+            )
+        self.num_columns = num_columns
+        self.rows: List[List[int]] = []
+        self.row_ids: List[int] = []
+        self.num_rows = 0
+        self._built = False
+
+    def add_row(self, row_id: int, column_indices: List[int]) -> None:
+        """
+        Queue a row for the matrix (bitmasks are built lazily on solve).
+
+        As with ArrayDLX.add_row, list arguments are stored without a
+        defensive copy; the matrix takes ownership.
+        """
+        if type(column_indices) is not list:
+            column_indices = list(column_indices)
+        if not column_indices:
+            return
+        self.rows.append(column_indices)
+        self.row_ids.append(row_id)
+        self.num_rows += 1
+
+    def _build(self) -> None:
+        """Pack rows into uint64 bitmask lanes and build per-cell row lists."""
+        R = len(self.rows)
+        masks = np.zeros((R, _BM_WORDS), dtype=np.uint64)
+        by_cell: List[List[int]] = [[] for _ in range(self.num_columns)]
+
+        for r, cols in enumerate(self.rows):
+            for col in cols:
+                masks[r, col >> 6] |= np.uint64(1) << np.uint64(col & 63)
+                by_cell[col].append(r)
+
+        cell_ptr = np.zeros(self.num_columns + 1, dtype=np.int32)
+        for cell, rows in enumerate(by_cell):
+            cell_ptr[cell + 1] = cell_ptr[cell] + len(rows)
+        cell_rows = np.empty(cell_ptr[-1], dtype=np.int32)
+        for cell, rows in enumerate(by_cell):
+            cell_rows[cell_ptr[cell]:cell_ptr[cell + 1]] = rows
+
+        # Bits beyond num_columns are marked covered so the "all covered"
+        # test can compare whole words.
+        full = np.zeros(_BM_WORDS, dtype=np.uint64)
+        for col in range(self.num_columns):
+            full[col >> 6] |= np.uint64(1) << np.uint64(col & 63)
+
+        self.masks = masks
+        self.cell_ptr = cell_ptr
+        self.cell_rows = cell_rows
+        self.full = full
+        self._covered = np.zeros(_BM_WORDS, dtype=np.uint64)
+
+        max_depth = self.num_columns + 1
+        self._stk_cell = np.zeros(max_depth, dtype=np.int32)
+        self._stk_k = np.zeros(max_depth, dtype=np.int32)
+        self._stk_row = np.zeros(max_depth, dtype=np.int32)
+        self._state = np.array([0, _ST_ENTER], dtype=np.int32)
+        self._built = True
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the entire search space has been explored."""
+        return self._built and self._state[1] == _ST_DONE
+
+    def solve(self, callback: Callable[[List[int]], bool] = None,
+              batch_size: int = 64) -> Generator[List[int], None, None]:
+        """Solve, yielding solutions as row-id lists (same as ArrayDLX)."""
+        if not self._built:
+            self._build()
+
+        out_rows = np.empty((batch_size, self.num_columns), dtype=np.int32)
+        out_lens = np.empty(batch_size, dtype=np.int32)
+
+        while not self.exhausted:
+            n = _bm_search_batch(
+                self.masks, self.cell_ptr, self.cell_rows,
+                self._covered, self.full,
+                self._stk_cell, self._stk_k, self._stk_row, self._state,
+                out_rows, out_lens, batch_size
+            )
+            for i in range(n):
+                solution = [self.row_ids[r] for r in out_rows[i, :out_lens[i]]]
+                if callback is not None:
+                    if callback(solution):
+                        return
+                yield solution
 
 
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
-def build_dlx_matrix(num_columns: int, rows: List[List[int]]) -> DancingLinks:
+def build_dlx_matrix(num_columns: int, rows,
+                     column_priority: Optional[np.ndarray] = None) -> ArrayDLX:
     """
     Build a DLX matrix from a list of rows.
-    
+
+    A uniform-width 2D ndarray of column indices is loaded through
+    add_rows_bulk (compiled fill); anything else goes row by row.
+
     Args:
         num_columns: Total number of columns
-        rows: List of rows, where each row is a list of column indices
-    
+        rows: List of rows (each a list of column indices), or a 2D
+            integer ndarray for uniform-width instances
+        column_priority: Optional per-column MRV tie-break rank
+            (see ArrayDLX)
+
     Returns:
-        Configured DancingLinks instance
+        Configured ArrayDLX instance (array-backed, Numba-compiled search)
     """
-    dlx = DancingLinks(num_columns)
+    dlx = ArrayDLX(num_columns, column_priority=column_priority)
+    if isinstance(rows, np.ndarray):
+        dlx.add_rows_bulk(rows)
+        return dlx
+    # No per-row defensive copy: add_row never mutates its argument and
+    # only copies when handed a non-list iterable
     for row_id, column_indices in enumerate(rows):
-        dlx.add_row(row_id, list(column_indices))
+        dlx.add_row(row_id, column_indices)
     return dlx
 
 
-def solve_exact_cover(num_columns: int, rows: List[List[int]], 
+def solve_exact_cover(num_columns: int, rows,
                       max_solutions: int = None) -> Generator[List[int], None, None]:
     """
     Solve an exact cover problem.
-    
+
     Args:
         num_columns: Number of columns (items to cover)
-        rows: List of rows (each row is a list of column indices it covers)
+        rows: List of rows (each row is a list of column indices it
+            covers), or a 2D integer ndarray for uniform-width instances
         max_solutions: Maximum number of solutions to find (None for all)
     
     Yields:
@@ -359,10 +1076,45 @@ def solve_exact_cover(num_columns: int, rows: List[List[int]],
             break
 
 
+def solve_exact_cover_parallel(num_columns: int, rows,
+                               n_workers: Optional[int] = None) -> List[List[int]]:
+    """
+    Enumerate ALL solutions using one worker per root-branch subtree.
+
+    Convenience wrapper over ArrayDLX.solve_parallel: the search tree is
+    partitioned at the root MRV column (one independent subtree per
+    candidate row) and the branches run concurrently. Workers are threads
+    rather than processes - the compiled kernel releases the GIL, so
+    threads get the same parallelism without pickling the matrix to each
+    worker.
+
+    Args:
+        num_columns: Number of columns (items to cover)
+        rows: List of rows, or a 2D integer ndarray (as solve_exact_cover)
+        n_workers: Worker count (default: os.cpu_count())
+
+    Returns:
+        All solutions as lists of row indices (order not guaranteed)
+    """
+    return build_dlx_matrix(num_columns, rows).solve_parallel(num_workers=n_workers)
+
+
 # =============================================================================
 # VERIFICATION / TESTING
 # =============================================================================
 
+def _walk_row_ring(R, start: int, width: int) -> List[int]:
+    """Follow R links around a row ring, returning the visited node ids."""
+    nodes = []
+    j = R[start]
+    for _ in range(width):
+        if j == start:
+            break
+        nodes.append(int(j))
+        j = R[j]
+    return nodes
+
+
 def verify_exact_cover() -> None:
     """
     Verify the DLX implementation with a simple test case.
@@ -411,7 +1163,61 @@ def verify_exact_cover() -> None:
     
     assert covered == set(range(num_columns)), "Not all columns covered"
     print("✓ Solution covers all columns exactly once")
-    
+
+    # Row nodes must occupy consecutive ids so horizontal traversal stays
+    # within one cache line per link array
+    dlx = build_dlx_matrix(num_columns, rows)
+    L, R, U, D, COL, ROW, SIZE = dlx._build_arrays()
+    node = num_columns + 1
+    for row in rows:
+        ring = sorted(range(node, node + len(row)))
+        walked = sorted(set([node]) | {int(x) for x in
+                        _walk_row_ring(R, node, len(row))})
+        assert walked == ring, f"Row nodes not contiguous: {walked} vs {ring}"
+        node += len(row)
+    print("✓ Row nodes are allocated in contiguous blocks")
+
+    # Bulk-loaded uniform-width rows must solve identically to per-row adds
+    uniform_rows = [[0, 1], [2, 3], [0, 2], [1, 3], [0, 3]]
+    per_row = sorted(sorted(s) for s in build_dlx_matrix(4, uniform_rows).solve())
+    bulk = sorted(sorted(s) for s in
+                  build_dlx_matrix(4, np.array(uniform_rows, dtype=np.int32)).solve())
+    assert bulk == per_row, f"Bulk load mismatch: {bulk} vs {per_row}"
+    print(f"✓ Bulk row loading matches per-row add_row ({len(bulk)} solutions)")
+
+    # copy_solutions=False must yield the same solutions when the caller
+    # consumes (copies) each one before advancing the generator
+    dl = DancingLinks(num_columns)
+    for row_id, cols in enumerate(rows):
+        dl.add_row(row_id, cols)
+    live = sorted(sorted(s) for s in
+                  (list(sol) for sol in dl.solve(copy_solutions=False)))
+    assert live == [sorted(expected)], f"Zero-copy yield mismatch: {live}"
+    print("✓ Zero-copy solution yield matches the copying default")
+
+    # Tie-break priorities change only the exploration order, never the
+    # solution set
+    pri = np.arange(num_columns, 0, -1, dtype=np.int32)
+    with_pri = sorted(sorted(s) for s in
+                      build_dlx_matrix(num_columns, rows, column_priority=pri).solve())
+    assert with_pri == [sorted(expected)], f"Priority changed solutions: {with_pri}"
+    print("✓ Column priority tie-break preserves the solution set")
+
+    # Parallel enumeration must agree with the sequential kernel on a
+    # multi-solution instance (2 columns x 2 disjoint singleton rows each)
+    multi_rows = [[0], [0], [1], [1]]
+    sequential = sorted(sorted(s) for s in build_dlx_matrix(2, multi_rows).solve())
+    parallel = sorted(sorted(s) for s in build_dlx_matrix(2, multi_rows).solve_parallel())
+    assert sequential == parallel, f"Parallel mismatch: {parallel} vs {sequential}"
+    assert len(parallel) == 4, f"Expected 4 solutions, got {len(parallel)}"
+    print(f"✓ Parallel root-branch search matches sequential ({len(parallel)} solutions)")
+
+    # The module-level wrapper must agree with the generator interface
+    wrapped = sorted(sorted(s) for s in
+                     solve_exact_cover_parallel(num_columns, rows, n_workers=2))
+    assert wrapped == [sorted(expected)], f"Wrapper mismatch: {wrapped}"
+    print("✓ solve_exact_cover_parallel matches solve_exact_cover")
+
     print("\n✓ Exact cover verification complete!")
 
 
@@ -28,10 +28,23 @@ Output Format:
 """
 
 import json
+import numpy as np
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List
 from .placements import NUM_CELLS, NUM_PIECES, CUBE_SIZE
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dumps(data) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
 
 def solution_to_json(solution: List[List[tuple]], solution_id: int) -> Dict[str, Any]:
     """
@@ -44,12 +57,10 @@ def solution_to_json(solution: List[List[tuple]], solution_id: int) -> Dict[str,
     Returns:
         Dictionary ready for JSON serialization
     """
-    pieces = []
-    for piece in solution:
-        # Convert tuples to lists for JSON
-        piece_coords = [[x, y, z] for x, y, z in piece]
-        pieces.append(piece_coords)
-    
+    # One C-level conversion to nested lists instead of a per-coordinate
+    # Python comprehension
+    pieces = np.asarray(solution, dtype=np.int8).tolist()
+
     return {
         "id": solution_id,
         "pieces": pieces
@@ -93,7 +104,50 @@ def export_solutions(solutions: List[List[List[tuple]]],
     print(f"Exported {len(solutions)} solutions to {output_path}")
 
 
-def export_solutions_compact(solutions: List[List[List[tuple]]], 
+def export_solutions_streaming(solutions: Iterable[List[List[tuple]]],
+                               output_path: str) -> int:
+    """
+    Export solutions incrementally, one at a time.
+
+    Accepts any iterable - in particular the solver's own solve()
+    generator - and writes each solution as soon as it arrives, so peak
+    memory stays at one solution instead of the whole list plus the
+    serialized buffer. Output format matches export_solutions (compact,
+    no indentation).
+
+    Args:
+        solutions: Iterable of solutions
+        output_path: Path to output JSON file
+
+    Returns:
+        Number of solutions written
+    """
+    metadata = {
+        "problem": f"{CUBE_SIZE}x{CUBE_SIZE}x{CUBE_SIZE} cube with T-tetracubes",
+        "cube_size": CUBE_SIZE,
+        "total_cells": NUM_CELLS,
+        "pieces_per_solution": NUM_PIECES,
+        "piece_type": "T-tetracube",
+        "cells_per_piece": 4,
+        "symmetry_group": "cube rotations (24 elements)",
+        "generated_at": datetime.now().isoformat()
+    }
+
+    count = 0
+    with open(output_path, 'wb') as f:
+        f.write(b'{"metadata": ' + _dumps(metadata) + b', "solutions": [')
+        for i, solution in enumerate(solutions):
+            if i:
+                f.write(b',\n')
+            f.write(_dumps(solution_to_json(solution, i)))
+            count += 1
+        f.write(b']}\n')
+
+    print(f"Exported {count} solutions (streaming) to {output_path}")
+    return count
+
+
+def export_solutions_compact(solutions: List[List[List[tuple]]],
                              output_path: str) -> None:
     """
     Export solutions in a compact format (pieces only, no metadata).
@@ -104,14 +158,9 @@ def export_solutions_compact(solutions: List[List[List[tuple]]],
         solutions: List of solutions
         output_path: Path to output JSON file
     """
-    # Just output array of solutions, each solution is array of pieces
-    data = []
-    for solution in solutions:
-        sol_data = []
-        for piece in solution:
-            piece_coords = [[x, y, z] for x, y, z in piece]
-            sol_data.append(piece_coords)
-        data.append(sol_data)
+    # Just output array of solutions, each solution is array of pieces;
+    # the nested lists are built by one C-level .tolist() per solution
+    data = [np.asarray(solution, dtype=np.int8).tolist() for solution in solutions]
     
     with open(output_path, 'w') as f:
         json.dump(data, f)
@@ -173,5 +222,17 @@ if __name__ == "__main__":
     # Verify JSON serialization works
     json_str = json.dumps(json_data)
     print(f"  - JSON string length: {len(json_str)} bytes")
-    
+
+    # Streaming export must produce valid JSON from a generator
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "stream.json")
+        written = export_solutions_streaming(iter([fake_solution] * 3), path)
+        with open(path) as f:
+            data = json.load(f)
+        assert written == 3 and len(data["solutions"]) == 3
+        assert data["solutions"][0]["pieces"] == json_data["pieces"]
+    print("  - Streaming export round-trips")
+
     print("\n✓ Export module verification complete!")
@@ -186,22 +186,29 @@ def generate_unique_orientations() -> List[List[Point3D]]:
     Returns:
         List of unique orientations, each as a list of normalized coordinates
     """
-    rotations = generate_rotation_matrices()
-    
-    seen: Set[Orientation] = set()
+    # All 24 rotations applied to all 4 points in one einsum:
+    # (24,3,3) x (4,3) -> (24,4,3), then a broadcast normalize, instead
+    # of 96 tiny Python-level matmuls
+    R_all = np.stack(generate_rotation_matrices())
+    pts = np.array(T_PIECE_CANONICAL, dtype=np.int64)
+    all_rot = np.einsum('kij,pj->kpi', R_all, pts)
+    all_rot -= all_rot.min(axis=1, keepdims=True)
+
+    seen: Set[bytes] = set()
     unique_orientations: List[List[Point3D]] = []
-    
-    for R in rotations:
-        rotated = rotate_piece(T_PIECE_CANONICAL, R)
-        normalized = normalize_piece(rotated)
-        key = piece_to_frozenset(normalized)
-        
+
+    for rotated in all_rot:
+        # Sort the 4 points lexicographically; the sorted int8 buffer
+        # (12 bytes) doubles as the dedup key - much lighter to hash
+        # than a frozenset of tuples
+        order = np.lexsort((rotated[:, 2], rotated[:, 1], rotated[:, 0]))
+        canonical = rotated[order].astype(np.int8)
+        key = canonical.tobytes()
+
         if key not in seen:
             seen.add(key)
-            # Sort for consistent ordering
-            sorted_orientation = sorted(normalized)
-            unique_orientations.append(sorted_orientation)
-    
+            unique_orientations.append([tuple(p) for p in canonical.tolist()])
+
     return unique_orientations
 
 
@@ -209,9 +216,55 @@ def generate_unique_orientations() -> List[List[Point3D]]:
 # MODULE-LEVEL CACHED DATA
 # =============================================================================
 
-# Cache the rotation matrices and orientations at module load time
-ROTATION_MATRICES: List[np.ndarray] = generate_rotation_matrices()
-T_ORIENTATIONS: List[List[Point3D]] = generate_unique_orientations()
+# Precomputed at build time from the generator functions above (see
+# verify_geometry, which checks they still agree). Importing the module
+# now costs microseconds instead of 64 matrix powers and 24 matmul/
+# normalize passes. Entries are in {-1, 0, 1}, so int8 is enough.
+_ROTATION_MATRIX_DATA = (
+    ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    ((0, -1, 0), (1, 0, 0), (0, 0, 1)),
+    ((-1, 0, 0), (0, -1, 0), (0, 0, 1)),
+    ((0, 1, 0), (-1, 0, 0), (0, 0, 1)),
+    ((0, 0, 1), (0, 1, 0), (-1, 0, 0)),
+    ((0, 0, 1), (1, 0, 0), (0, 1, 0)),
+    ((0, 0, 1), (0, -1, 0), (1, 0, 0)),
+    ((0, 0, 1), (-1, 0, 0), (0, -1, 0)),
+    ((-1, 0, 0), (0, 1, 0), (0, 0, -1)),
+    ((0, 1, 0), (1, 0, 0), (0, 0, -1)),
+    ((1, 0, 0), (0, -1, 0), (0, 0, -1)),
+    ((0, -1, 0), (-1, 0, 0), (0, 0, -1)),
+    ((0, 0, -1), (0, 1, 0), (1, 0, 0)),
+    ((0, 0, -1), (1, 0, 0), (0, -1, 0)),
+    ((0, 0, -1), (0, -1, 0), (-1, 0, 0)),
+    ((0, 0, -1), (-1, 0, 0), (0, 1, 0)),
+    ((1, 0, 0), (0, 0, -1), (0, 1, 0)),
+    ((0, -1, 0), (0, 0, -1), (1, 0, 0)),
+    ((-1, 0, 0), (0, 0, -1), (0, -1, 0)),
+    ((0, 1, 0), (0, 0, -1), (-1, 0, 0)),
+    ((-1, 0, 0), (0, 0, 1), (0, 1, 0)),
+    ((0, 1, 0), (0, 0, 1), (1, 0, 0)),
+    ((1, 0, 0), (0, 0, 1), (0, -1, 0)),
+    ((0, -1, 0), (0, 0, 1), (-1, 0, 0)),
+)
+
+ROTATION_MATRICES: List[np.ndarray] = [
+    np.array(m, dtype=np.int8) for m in _ROTATION_MATRIX_DATA
+]
+
+T_ORIENTATIONS: List[List[Point3D]] = [
+    [(0, 0, 0), (1, 0, 0), (1, 1, 0), (2, 0, 0)],
+    [(0, 1, 0), (1, 0, 0), (1, 1, 0), (1, 2, 0)],
+    [(0, 1, 0), (1, 0, 0), (1, 1, 0), (2, 1, 0)],
+    [(0, 0, 0), (0, 1, 0), (0, 2, 0), (1, 1, 0)],
+    [(0, 0, 0), (0, 0, 1), (0, 0, 2), (0, 1, 1)],
+    [(0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 2, 0)],
+    [(0, 0, 1), (0, 1, 0), (0, 1, 1), (0, 1, 2)],
+    [(0, 0, 1), (0, 1, 0), (0, 1, 1), (0, 2, 1)],
+    [(0, 0, 0), (1, 0, 0), (1, 0, 1), (2, 0, 0)],
+    [(0, 0, 1), (1, 0, 0), (1, 0, 1), (1, 0, 2)],
+    [(0, 0, 1), (1, 0, 0), (1, 0, 1), (2, 0, 1)],
+    [(0, 0, 0), (0, 0, 1), (0, 0, 2), (1, 0, 1)],
+]
 
 
 def get_orientations() -> List[List[Point3D]]:
@@ -247,6 +300,14 @@ def verify_geometry() -> None:
     # Check rotations
     assert len(ROTATION_MATRICES) == 24, f"Expected 24 rotations, got {len(ROTATION_MATRICES)}"
     print(f"✓ Generated {len(ROTATION_MATRICES)} rotation matrices")
+
+    # The hardcoded tables must match what the generators produce
+    regenerated = generate_rotation_matrices()
+    assert all(np.array_equal(a, b) for a, b in zip(ROTATION_MATRICES, regenerated)), \
+        "ROTATION_MATRICES literal is stale - regenerate from generate_rotation_matrices()"
+    assert T_ORIENTATIONS == generate_unique_orientations(), \
+        "T_ORIENTATIONS literal is stale - regenerate from generate_unique_orientations()"
+    print("✓ Precomputed tables match the generator functions")
     
     # Verify all matrices are orthogonal with det=+1
     for i, R in enumerate(ROTATION_MATRICES):
@@ -7,28 +7,47 @@ This module provides:
 3. 3D chunk pattern extraction (3+ pieces in compact 3D regions)
 """
 
+import numpy as np
+from numba import njit
 from typing import List, Tuple, Set, Dict, Optional
-from collections import defaultdict
-from .placements import Point3D, CUBE_SIZE
+from collections import Counter, deque
+from .placements import Point3D, CUBE_SIZE, point_to_index, is_in_bounds
 
 # =============================================================================
 # PIECE ANALYSIS
 # =============================================================================
 
+# Face-neighbor directions, shared by every adjacency scan in the module
+NEIGHBOR_OFFSETS = ((1,0,0), (-1,0,0), (0,1,0), (0,-1,0), (0,0,1), (0,0,-1))
+
+# Linear-index deltas for the same directions (+x, -x, +y, -y, +z, -z).
+# Only valid when the matching coordinate is off the face, so callers
+# pair them with explicit per-axis bounds checks rather than trusting
+# modulo wrap-around at cube faces.
+NEIGHBOR_IDX_DELTAS = (1, -1, CUBE_SIZE, -CUBE_SIZE,
+                       CUBE_SIZE * CUBE_SIZE, -(CUBE_SIZE * CUBE_SIZE))
+
+# The canonical in-module piece representation is a (4, 3) int16 array of
+# cell coordinates; to_array converts the list-of-tuples form that comes
+# in over the public API. The helpers below reduce along array axes, so
+# they accept either form and run the arithmetic in compiled code.
+
+def to_array(piece: List[Point3D]) -> np.ndarray:
+    """Convert a piece to its (num_cells, 3) int16 array form (idempotent)."""
+    return np.asarray(piece, dtype=np.int16)
+
 def get_piece_min_z(piece: List[Point3D]) -> int:
     """Get the minimum Z coordinate of a piece (height from ground)."""
-    return min(p[2] for p in piece)
+    return int(to_array(piece)[:, 2].min())
 
 def get_piece_max_z(piece: List[Point3D]) -> int:
     """Get the maximum Z coordinate of a piece."""
-    return max(p[2] for p in piece)
+    return int(to_array(piece)[:, 2].max())
 
 def get_piece_bounding_box(piece: List[Point3D]) -> Tuple[Tuple[int,int,int], Tuple[int,int,int]]:
     """Get (min_corner, max_corner) of piece bounding box."""
-    xs = [p[0] for p in piece]
-    ys = [p[1] for p in piece]
-    zs = [p[2] for p in piece]
-    return ((min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs)))
+    arr = to_array(piece)
+    return (tuple(arr.min(axis=0).tolist()), tuple(arr.max(axis=0).tolist()))
 
 def is_piece_grounded(piece: List[Point3D]) -> bool:
     """Check if piece touches the ground (z=0)."""
@@ -36,75 +55,132 @@ def is_piece_grounded(piece: List[Point3D]) -> bool:
 
 def piece_corner_distance(piece: List[Point3D]) -> float:
     """Calculate distance from piece's closest cell to corner (0,0,0)."""
-    return min((p[0]**2 + p[1]**2 + p[2]**2)**0.5 for p in piece)
+    arr = to_array(piece).astype(np.int32)
+    return float(np.sqrt((arr * arr).sum(axis=1).min()))
 
 def piece_min_coords(piece: List[Point3D]) -> Tuple[int, int, int]:
     """Get the minimum x, y, z coordinates of a piece."""
-    return (min(p[0] for p in piece), min(p[1] for p in piece), min(p[2] for p in piece))
+    return tuple(to_array(piece).min(axis=0).tolist())
+
+
+# =============================================================================
+# OCCUPANCY BITMASK
+# =============================================================================
+#
+# Placed cells are tracked as a single 216-bit Python int, one bit per
+# cell in point_to_index order. A membership probe is one shift-and-mask
+# on the bigint instead of hashing a 3-tuple into a set, and a whole
+# piece is committed with one OR.
+
+def cells_to_mask(cells: List[Point3D]) -> int:
+    """Pack a list of (x, y, z) cells into a 216-bit occupancy mask."""
+    mask = 0
+    for x, y, z in cells:
+        mask |= 1 << point_to_index(x, y, z)
+    return mask
+
+
+def _build_ray_masks() -> Tuple[List[int], List[int], List[int]]:
+    """
+    Per-cell escape-ray masks for the three outward directions.
+
+    RAY_PX[idx] has a bit set for every cell strictly beyond idx in +x
+    (likewise +y, +z), so "is the ray to the cube face clear?" is one
+    bitwise AND against the occupancy mask instead of a loop of up to
+    five per-cell probes.
+    """
+    ray_px = [0] * (CUBE_SIZE ** 3)
+    ray_py = [0] * (CUBE_SIZE ** 3)
+    ray_pz = [0] * (CUBE_SIZE ** 3)
+    for x in range(CUBE_SIZE):
+        for y in range(CUBE_SIZE):
+            for z in range(CUBE_SIZE):
+                idx = point_to_index(x, y, z)
+                for c in range(x + 1, CUBE_SIZE):
+                    ray_px[idx] |= 1 << point_to_index(c, y, z)
+                for c in range(y + 1, CUBE_SIZE):
+                    ray_py[idx] |= 1 << point_to_index(x, c, z)
+                for c in range(z + 1, CUBE_SIZE):
+                    ray_pz[idx] |= 1 << point_to_index(x, y, c)
+    return ray_px, ray_py, ray_pz
+
+
+RAY_PX, RAY_PY, RAY_PZ = _build_ray_masks()
+
+
+def _mask_to_words(mask: int) -> np.ndarray:
+    """Split a 216-bit occupancy mask into 4 uint64 lanes."""
+    words = np.empty(4, dtype=np.uint64)
+    for w in range(4):
+        words[w] = (mask >> (64 * w)) & 0xFFFFFFFFFFFFFFFF
+    return words
+
+
+# Escape-ray masks as (3, 216, 4) uint64 lanes (+z, +x, +y order), the
+# form the compiled wave kernel below consumes
+_RAY_WORDS: np.ndarray = np.stack([
+    np.stack([_mask_to_words(m) for m in rays])
+    for rays in (RAY_PZ, RAY_PX, RAY_PY)
+])
 
 
 # =============================================================================
 # ACCESSIBILITY CHECK - Can the piece physically be placed?
 # =============================================================================
 
-def is_piece_accessible(piece: List[Point3D], placed_cells: Set[Point3D]) -> bool:
+def is_piece_accessible(piece: List[Point3D], placed_mask: int) -> bool:
     """
     Check if a piece can be physically placed (has an opening).
-    
+
     A piece is accessible if at least one of its cells can be reached from
     outside the cube (from +x, +y, or +z direction without passing through
-    placed cells).
-    
+    placed cells). Each direction check is one AND between the placed
+    mask and the cell's precomputed escape-ray mask - O(1) regardless of
+    the distance to the cube face.
+
+    Per direction, only the piece's exposed cells (those without a
+    piece-mate as the next cell in that direction) need testing: a
+    covered cell's ray is its mate's ray plus the mate itself, which is
+    never in placed_mask, so a clear covered ray implies a clear exposed
+    ray further along. Cuts the 12 ray tests to at most 3 per direction.
+
     This ensures we don't create enclosed spaces that can't be filled.
     """
-    piece_set = set(tuple(p) for p in piece)
-    
+    cells = set(map(tuple, piece))
     for x, y, z in piece:
-        # Check if this cell is accessible from +z (top)
-        accessible_from_top = True
-        for check_z in range(z + 1, CUBE_SIZE):
-            if (x, y, check_z) in placed_cells:
-                accessible_from_top = False
-                break
-        if accessible_from_top:
-            return True
-        
-        # Check if accessible from +x side
-        accessible_from_x = True
-        for check_x in range(x + 1, CUBE_SIZE):
-            if (check_x, y, z) in placed_cells:
-                accessible_from_x = False
-                break
-        if accessible_from_x:
-            return True
-        
-        # Check if accessible from +y side  
-        accessible_from_y = True
-        for check_y in range(y + 1, CUBE_SIZE):
-            if (x, check_y, z) in placed_cells:
-                accessible_from_y = False
-                break
-        if accessible_from_y:
-            return True
-    
+        idx = point_to_index(x, y, z)
+        if (x + 1, y, z) not in cells and not placed_mask & RAY_PX[idx]:
+            return True  # Clear ray to the +x face
+        if (x, y + 1, z) not in cells and not placed_mask & RAY_PY[idx]:
+            return True  # Clear ray to the +y face
+        if (x, y, z + 1) not in cells and not placed_mask & RAY_PZ[idx]:
+            return True  # Clear ray to the top face
+
     return False
 
 
-def is_piece_supported(piece: List[Point3D], placed_cells: Set[Point3D]) -> bool:
+def is_piece_supported(piece: List[Point3D], placed_mask: int,
+                       min_z: Optional[int] = None) -> bool:
     """
     Check if a piece is fully gravity-supported.
     A piece is supported if:
     - It touches the ground (z=0), OR
     - Every cell at its lowest z-level has support below
+
+    Callers that already know the piece's min z (most keep it cached)
+    should pass it to skip the rescan. The BFS ordering hot path does
+    this check inside the compiled kernel via precomputed below-cell
+    indices; this helper serves the one-off callers.
     """
-    min_z = get_piece_min_z(piece)
+    if min_z is None:
+        min_z = get_piece_min_z(piece)
     if min_z == 0:
         return True
-    
+
     # Check if all cells at min_z have support below
     for x, y, z in piece:
         if z == min_z:
-            if (x, y, z - 1) not in placed_cells:
+            if not (placed_mask >> point_to_index(x, y, z - 1)) & 1:
                 return False
     return True
 
@@ -113,6 +189,67 @@ def is_piece_supported(piece: List[Point3D], placed_cells: Set[Point3D]) -> bool
 # CORNER-FIRST BFS ORDERING FOR TUTORIAL
 # =============================================================================
 
+@njit(cache=True)
+def _select_next_piece(alive, piece_cells, below_idx, below_ptr,
+                       nbr_idx, nbr_ptr, base_score,
+                       occ, occ_words, ray_words, any_placed):
+    """
+    Compiled candidate-selection wave for order_solution_bfs.
+
+    Scans the alive pieces in index order and returns the first piece
+    with the minimum score among those that are gravity-supported
+    (below-cell CSR segment fully occupied) and accessible (some cell
+    has an escape ray clear of the occupancy bit lanes). Returns -1 when
+    no piece qualifies; the caller then applies the fallback rule.
+    """
+    best_i = -1
+    best_score = 0.0
+    for i in range(alive.shape[0]):
+        if not alive[i]:
+            continue
+
+        # Gravity support: every cell below the lowest layer is occupied
+        supported = True
+        for k in range(below_ptr[i], below_ptr[i + 1]):
+            if occ[below_idx[k]] == 0:
+                supported = False
+                break
+        if not supported:
+            continue
+
+        if any_placed:
+            # Accessibility: some cell has a clear +z/+x/+y escape ray
+            accessible = False
+            for k in range(piece_cells.shape[1]):
+                idx = piece_cells[i, k]
+                for d in range(3):
+                    clear = True
+                    for w in range(4):
+                        if occ_words[w] & ray_words[d, idx, w]:
+                            clear = False
+                            break
+                    if clear:
+                        accessible = True
+                        break
+                if accessible:
+                    break
+            if not accessible:
+                continue
+
+            adjacency = 0
+            for k in range(nbr_ptr[i], nbr_ptr[i + 1]):
+                adjacency += occ[nbr_idx[k]]
+            score = base_score[i] - 5.0 * adjacency
+        else:
+            score = base_score[i]
+
+        if best_i < 0 or score < best_score:
+            best_score = score
+            best_i = i
+
+    return best_i
+
+
 def order_solution_bfs(pieces: List[List[Point3D]]) -> List[List[Point3D]]:
     """
     Reorder pieces using Corner-First BFS for physical assembly.
@@ -125,61 +262,84 @@ def order_solution_bfs(pieces: List[List[Point3D]]) -> List[List[Point3D]]:
     
     This ensures we build from the corner outward, layer by layer.
     """
-    remaining = [tuple(tuple(p) for p in piece) for piece in pieces]
+    n = len(pieces)
+    if n == 0:
+        return []
+    piece_tuples = [tuple(tuple(p) for p in piece) for piece in pieces]
+
+    # Per-piece constants, computed once instead of every wave
+    min_z = [get_piece_min_z(p) for p in piece_tuples]
+    corner_dist = [piece_corner_distance(p) for p in piece_tuples]
+    min_xy_sum = []
+    for p in piece_tuples:
+        mc = piece_min_coords(p)
+        min_xy_sum.append(mc[0] + mc[1])
+
+    # Flat arrays for the compiled wave kernel
+    piece_cells = np.array(
+        [[point_to_index(x, y, z) for x, y, z in p] for p in piece_tuples],
+        dtype=np.int32)
+
+    # Each piece's occupancy as 4 uint64 lanes, for committing placements
+    mask_words = np.zeros((n, 4), dtype=np.uint64)
+    for i, p in enumerate(piece_tuples):
+        mask_words[i] = _mask_to_words(cells_to_mask(p))
+
+    # Support CSR: the cells directly below each piece's lowest layer
+    # must all be occupied (empty segment when grounded)
+    below_flat: List[int] = []
+    below_ptr = np.zeros(n + 1, dtype=np.int32)
+    for i, (p, mz) in enumerate(zip(piece_tuples, min_z)):
+        if mz > 0:
+            for x, y, z in p:
+                if z == mz:
+                    below_flat.append(point_to_index(x, y, z - 1))
+        below_ptr[i + 1] = len(below_flat)
+    below_idx = np.array(below_flat, dtype=np.int32)
+
+    # Neighbor CSR: bounds-clipped 6-neighbor linear indices per piece,
+    # as a multiset (each cell/direction hit counts once, matching the
+    # original adjacency loop)
+    neighbor_flat: List[int] = []
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    for i, p in enumerate(piece_tuples):
+        for x, y, z in p:
+            idx = point_to_index(x, y, z)
+            for (dx, dy, dz), delta in zip(NEIGHBOR_OFFSETS, NEIGHBOR_IDX_DELTAS):
+                if is_in_bounds(x + dx, y + dy, z + dz):
+                    neighbor_flat.append(idx + delta)
+        indptr[i + 1] = len(neighbor_flat)
+    flat_idx = np.array(neighbor_flat, dtype=np.int32)
+
+    # Static score components, combined once
+    base_score = (np.array(min_z, dtype=np.float64) * 1000
+                  + np.array(corner_dist, dtype=np.float64) * 10
+                  + np.array(min_xy_sum, dtype=np.float64))
+
     ordered = []
-    placed_cells: Set[Point3D] = set()
-    
-    while remaining:
-        # Score each remaining piece
-        candidates = []
-        for piece in remaining:
-            # Must be supported (gravity-safe)
-            if not is_piece_supported(piece, placed_cells):
-                continue
-            
-            # Must be accessible (can physically place it)
-            if placed_cells and not is_piece_accessible(piece, placed_cells):
-                continue
-            
-            min_z = get_piece_min_z(piece)
-            corner_dist = piece_corner_distance(piece)
-            min_coords = piece_min_coords(piece)
-            
-            # Adjacency bonus: prefer pieces that connect to what's already built
-            adjacency_score = 0
-            if placed_cells:
-                for x, y, z in piece:
-                    for dx, dy, dz in [(1,0,0), (-1,0,0), (0,1,0), (0,-1,0), (0,0,1), (0,0,-1)]:
-                        if (x+dx, y+dy, z+dz) in placed_cells:
-                            adjacency_score += 1
-            
-            # Score: prioritize grounded, close to corner, adjacent to existing
-            # Lower score = better
-            score = (
-                min_z * 1000 +           # Strongly prefer lower z
-                corner_dist * 10 -       # Prefer closer to corner
-                adjacency_score * 5 +    # Bonus for adjacency (subtract)
-                min_coords[0] + min_coords[1]  # Tie-break by x+y
-            )
-            
-            candidates.append((score, piece))
-        
-        if not candidates:
+    occ = np.zeros(CUBE_SIZE ** 3, dtype=np.uint8)  # occupancy vector
+    occ_words = np.zeros(4, dtype=np.uint64)        # same, as bit lanes
+    alive = np.ones(n, dtype=np.bool_)
+    placed_count = 0
+
+    while placed_count < n:
+        best_i = int(_select_next_piece(
+            alive, piece_cells, below_idx, below_ptr, flat_idx, indptr,
+            base_score, occ, occ_words, _RAY_WORDS, placed_count > 0))
+
+        if best_i < 0:
             # Fallback: take the piece with lowest z and closest to corner
-            remaining.sort(key=lambda p: (get_piece_min_z(p), piece_corner_distance(p)))
-            next_piece = remaining.pop(0)
-        else:
-            # Take the best candidate
-            candidates.sort(key=lambda x: x[0])
-            next_piece = candidates[0][1]
-            remaining.remove(next_piece)
-        
-        ordered.append(list(next_piece))
-        
-        # Add cells to placed set
-        for cell in next_piece:
-            placed_cells.add(tuple(cell))
-    
+            best_i = min((i for i in range(n) if alive[i]),
+                         key=lambda i: (min_z[i], corner_dist[i]))
+
+        alive[best_i] = False
+        placed_count += 1
+        ordered.append(list(piece_tuples[best_i]))
+
+        # Commit the piece's cells
+        occ[piece_cells[best_i]] = 1
+        occ_words |= mask_words[best_i]
+
     return ordered
 
 
@@ -193,118 +353,199 @@ order_solution_for_tutorial = order_solution_bfs
 
 def get_piece_orientation(piece: List[Point3D]) -> str:
     """Determine the orientation of a T-piece."""
-    zs = set(p[2] for p in piece)
-    ys = set(p[1] for p in piece)
-    xs = set(p[0] for p in piece)
-    
-    if len(zs) == 1:
+    arr = to_array(piece)
+    span = arr.max(axis=0) - arr.min(axis=0)
+
+    if span[2] == 0:
         return "flat"     # Lying flat in XY plane
-    elif len(ys) == 1:
+    elif span[1] == 0:
         return "wall_xz"  # Standing in XZ plane
-    elif len(xs) == 1:
+    elif span[0] == 0:
         return "wall_yz"  # Standing in YZ plane
     else:
         return "3d"       # True 3D orientation
 
 
-def are_pieces_adjacent(piece1: List[Point3D], piece2: List[Point3D]) -> bool:
-    """Check if two pieces share at least one face."""
-    cells1 = set(tuple(c) for c in piece1)
-    for x, y, z in piece2:
-        for dx, dy, dz in [(1,0,0), (-1,0,0), (0,1,0), (0,-1,0), (0,0,1), (0,0,-1)]:
-            if (x+dx, y+dy, z+dz) in cells1:
-                return True
-    return False
+def build_piece_adjacency(pieces: List[List[Point3D]]) -> List[Set[int]]:
+    """
+    Build the piece-to-piece face-adjacency graph of a solution.
+
+    One pass fills a cell -> owning-piece lookup, a second scans every
+    cell's 6 neighbors against it. Computed once per solution and shared
+    by all the chunk-extraction BFSs, instead of re-deriving adjacency
+    pairwise (set construction + 24 probes) at every BFS step.
+
+    Returns:
+        adj[i] = set of piece indices sharing a face with piece i
+    """
+    owner = np.full(CUBE_SIZE ** 3, -1, dtype=np.int16)
+    for i, piece in enumerate(pieces):
+        for cell in piece:
+            owner[point_to_index(*cell)] = i
+
+    adj: List[Set[int]] = [set() for _ in pieces]
+    for i, piece in enumerate(pieces):
+        for x, y, z in piece:
+            idx = point_to_index(x, y, z)
+            for (dx, dy, dz), delta in zip(NEIGHBOR_OFFSETS, NEIGHBOR_IDX_DELTAS):
+                if is_in_bounds(x + dx, y + dy, z + dz):
+                    j = int(owner[idx + delta])
+                    if j >= 0 and j != i:
+                        adj[i].add(j)
+    return adj
 
 
-def find_connected_group(start_idx: int, pieces: List[List[Point3D]], 
-                         max_size: int = 6) -> List[int]:
+def find_connected_group(start_idx: int, pieces: List[List[Point3D]],
+                         max_size: int = 6,
+                         adjacency: Optional[List[Set[int]]] = None) -> List[int]:
     """
     Find a connected group of pieces starting from start_idx.
     Uses BFS to find adjacent pieces up to max_size.
+
+    Callers extracting several groups from one solution should build the
+    adjacency graph once with build_piece_adjacency and pass it in.
     """
+    if adjacency is None:
+        adjacency = build_piece_adjacency(pieces)
+
     group = [start_idx]
-    queue = [start_idx]
-    visited = {start_idx}
-    
+    queue = deque([start_idx])
+    # Flag array instead of a set: O(1) membership without hashing
+    visited = np.zeros(len(pieces), dtype=bool)
+    visited[start_idx] = True
+
     while queue and len(group) < max_size:
-        current = queue.pop(0)
-        current_piece = pieces[current]
-        
-        for i, piece in enumerate(pieces):
-            if i in visited:
+        current = queue.popleft()
+
+        # Ascending order matches the old full index scan
+        for i in sorted(adjacency[current]):
+            if visited[i]:
                 continue
-            if are_pieces_adjacent(current_piece, piece):
-                visited.add(i)
-                group.append(i)
-                queue.append(i)
-                if len(group) >= max_size:
-                    break
-    
+            visited[i] = True
+            group.append(i)
+            queue.append(i)
+            if len(group) >= max_size:
+                break
+
     return group
 
 
 def get_chunk_dimensions(pieces: List[List[Point3D]]) -> Tuple[int, int, int]:
     """Get the bounding box dimensions of a group of pieces."""
-    all_cells = [cell for piece in pieces for cell in piece]
-    if not all_cells:
+    if len(pieces) == 0:
         return (0, 0, 0)
-    
-    xs = [c[0] for c in all_cells]
-    ys = [c[1] for c in all_cells]
-    zs = [c[2] for c in all_cells]
-    
-    return (max(xs) - min(xs) + 1, max(ys) - min(ys) + 1, max(zs) - min(zs) + 1)
 
+    cells = np.asarray(pieces, dtype=np.int16).reshape(-1, 3)
+    return tuple((np.ptp(cells, axis=0) + 1).tolist())
 
-def normalize_chunk(pieces: List[List[Point3D]]) -> Tuple[Tuple[Tuple[int,int,int], ...], ...]:
-    """Normalize a chunk to a canonical form for comparison."""
-    all_cells = [cell for piece in pieces for cell in piece]
-    if not all_cells:
-        return tuple()
-    
-    # Translate to origin
-    min_x = min(c[0] for c in all_cells)
-    min_y = min(c[1] for c in all_cells)
-    min_z = min(c[2] for c in all_cells)
-    
-    normalized_pieces = []
-    for piece in pieces:
-        normalized = tuple(sorted((c[0] - min_x, c[1] - min_y, c[2] - min_z) for c in piece))
-        normalized_pieces.append(normalized)
-    
-    return tuple(sorted(normalized_pieces))
+
+def normalize_chunk(pieces: List[List[Point3D]]) -> bytes:
+    """
+    Normalize a chunk to a canonical key for comparison.
+
+    Translate-to-origin and both sorting levels run on a small int16
+    array; each piece becomes a fixed 12-byte string (4 cells x 3 int8
+    coords in lexicographic order) and the key is the sorted
+    concatenation - one flat hashable bytes object instead of nested
+    tuples, with the same equivalence (and even the same ordering, since
+    byte and tuple comparison agree on non-negative coordinates).
+    """
+    if not pieces:
+        return b''
+
+    arr = np.asarray(pieces, dtype=np.int16)
+    arr -= arr.reshape(-1, 3).min(axis=0)
+
+    keys = []
+    for piece in arr:
+        order = np.lexsort((piece[:, 2], piece[:, 1], piece[:, 0]))
+        keys.append(piece[order].astype(np.int8).tobytes())
+
+    return b'|'.join(sorted(keys))
 
 
-def classify_chunk(pieces: List[List[Point3D]], dims: Tuple[int, int, int]) -> Dict:
-    """Classify a chunk pattern by its characteristics."""
+# Chunk classification table: kind index -> (type, difficulty, tip
+# template). The shape predicates in classify_chunk reduce to one of
+# these indices, so the per-chunk work is a single tuple lookup plus a
+# tip format.
+_KIND_LAYER = 0
+_KIND_3D_CORNER = 1
+_KIND_COLUMN = 2
+_KIND_REGION_HARD = 3
+_KIND_REGION = 4
+
+_CLASSIFY_TABLE = (
+    ("layer", "easy",
+     "A flat {dx}×{dy} layer pattern - great for building the base"),
+    ("3d_corner", "medium",
+     "A compact 3D corner chunk - pieces interlock in all directions"),
+    ("column", "easy",
+     "A vertical column pattern - stack these to build height"),
+    ("region", "hard",
+     "A {dx}×{dy}×{dz} region - visualize how pieces mesh together"),
+    ("region", "medium",
+     "A {dx}×{dy}×{dz} region - visualize how pieces mesh together"),
+)
+
+
+class SolutionMeta:
+    """
+    Per-solution precomputed geometry shared by the chunk extractors.
+
+    Holds the stacked (N, 4, 3) coordinate array, per-piece axis spans
+    and minimum coordinates, and the piece adjacency graph - everything
+    the extraction passes would otherwise re-derive piece by piece, and
+    twice over when both the compact and the corner extractor run on the
+    same solution (as PatternAccumulator.update does).
+    """
+
+    def __init__(self, solution: List[List[Point3D]]):
+        self.pieces = solution
+        self.arr = np.asarray(solution, dtype=np.int16)
+        self.span = np.ptp(self.arr, axis=1)
+        self.min_coords = self.arr.min(axis=1)
+        self.adjacency = build_piece_adjacency(solution)
+
+    def chunk_dimensions(self, indices: List[int]) -> Tuple[int, int, int]:
+        """Bounding-box dimensions of the pieces at the given indices."""
+        cells = self.arr[indices].reshape(-1, 3)
+        return tuple((np.ptp(cells, axis=0) + 1).tolist())
+
+
+def classify_chunk(pieces: List[List[Point3D]], dims: Tuple[int, int, int],
+                   span: Optional[np.ndarray] = None) -> Dict:
+    """
+    Classify a chunk pattern by its characteristics.
+
+    Callers holding a SolutionMeta can pass the group's rows of its span
+    table to skip recomputing them.
+    """
     dx, dy, dz = dims
     num_pieces = len(pieces)
-    
-    orientations = [get_piece_orientation(p) for p in pieces]
-    flat_count = orientations.count("flat")
-    wall_count = orientations.count("wall_xz") + orientations.count("wall_yz")
-    threed_count = orientations.count("3d")
-    
-    # Determine chunk type
+
+    # Per-piece axis spans over the stacked (N, 4, 3) array classify all
+    # orientations at once: flat (z span 0), wall (one horizontal span 0)
+    if span is None:
+        span = np.ptp(np.asarray(pieces, dtype=np.int16), axis=1)
+    flat = span[:, 2] == 0
+    wall = ~flat & ((span[:, 1] == 0) | (span[:, 0] == 0))
+    flat_count = int(flat.sum())
+    wall_count = int(wall.sum())
+    threed_count = num_pieces - flat_count - wall_count
+
+    # Reduce the shape tests to a table index, then look up the
+    # (type, difficulty, tip template) triple
     if dz == 1:
-        chunk_type = "layer"
-        difficulty = "easy"
-        tip = f"A flat {dx}×{dy} layer pattern - great for building the base"
+        kind = _KIND_LAYER
     elif dx <= 3 and dy <= 3 and dz <= 3:
-        if threed_count > 0 or (flat_count > 0 and wall_count > 0):
-            chunk_type = "3d_corner"
-            difficulty = "medium"
-            tip = f"A compact 3D corner chunk - pieces interlock in all directions"
-        else:
-            chunk_type = "column"
-            difficulty = "easy"
-            tip = f"A vertical column pattern - stack these to build height"
+        interlocked = threed_count > 0 or (flat_count > 0 and wall_count > 0)
+        kind = _KIND_3D_CORNER if interlocked else _KIND_COLUMN
     else:
-        chunk_type = "region"
-        difficulty = "hard" if threed_count > 1 else "medium"
-        tip = f"A {dx}×{dy}×{dz} region - visualize how pieces mesh together"
-    
+        kind = _KIND_REGION_HARD if threed_count > 1 else _KIND_REGION
+
+    chunk_type, difficulty, tip_fmt = _CLASSIFY_TABLE[kind]
+    tip = tip_fmt.format(dx=dx, dy=dy, dz=dz)
+
     return {
         "type": chunk_type,
         "difficulty": difficulty,
@@ -319,106 +560,149 @@ def classify_chunk(pieces: List[List[Point3D]], dims: Tuple[int, int, int]) -> D
     }
 
 
-def extract_3d_chunks(solution: List[List[Point3D]], 
-                       min_pieces: int = 3, 
-                       max_pieces: int = 4) -> List[Dict]:
+def _extract_chunks_core(solution: List[List[Point3D]],
+                         meta: Optional[SolutionMeta],
+                         min_pieces: int,
+                         group_sizes,
+                         accept_fn,
+                         mark_used_fn) -> List[Dict]:
     """
-    Extract interesting 3D chunks from a solution.
-    Finds groups of 3-4 connected pieces that form compact 3D patterns.
-    Prefers chunks that fit within ~3x3x3 or similar compact regions.
+    Shared BFS + dimension + classification pipeline behind the 3D chunk
+    extractors.
+
+    For every unused start piece, the first group size whose connected
+    group passes accept_fn yields a chunk; accept_fn returns extra fields
+    to merge into the chunk dict (e.g. a compactness score) or None to
+    reject. mark_used_fn(used_starts, start_idx, group_or_None) applies
+    the caller's overlap policy after each start. The public wrappers
+    differ only in these two hooks, so optimizations to the pipeline land
+    in one place.
     """
+    if meta is None:
+        meta = SolutionMeta(solution)
+
     chunks = []
     used_starts = set()
-    
+
     for start_idx in range(len(solution)):
         if start_idx in used_starts:
             continue
-        
-        # Try different group sizes, preferring smaller compact groups
-        for target_size in range(min_pieces, max_pieces + 1):
-            group_indices = find_connected_group(start_idx, solution, target_size)
-            
+
+        accepted = None
+        for target_size in group_sizes:
+            group_indices = find_connected_group(start_idx, solution,
+                                                 target_size, meta.adjacency)
+
             if len(group_indices) < min_pieces:
                 break
-            
-            group_pieces = [solution[i] for i in group_indices]
-            dims = get_chunk_dimensions(group_pieces)
-            
-            # Prefer compact chunks: max dimension <= 4 for learning
-            max_dim = max(dims)
-            if max_dim > 4:
-                continue
-                
-            total_cells = len(group_indices) * 4
-            volume = dims[0] * dims[1] * dims[2]
-            
-            # Density check: chunks should fill at least 40% of their bounding box
-            density = total_cells / volume
-            if density < 0.4:
+
+            dims = meta.chunk_dimensions(group_indices)
+            extra = accept_fn(group_indices, dims)
+            if extra is None:
                 continue
-            
-            # Require 3D structure (not flat)
-            if dims[2] > 1 and (dims[0] > 1 or dims[1] > 1):
-                classification = classify_chunk(group_pieces, dims)
-                
-                # Score compactness: prefer smaller, denser chunks
-                compactness = density * 10 - max_dim
-                
-                chunks.append({
-                    "indices": group_indices,
-                    "pieces": group_pieces,
-                    "dimensions": dims,
-                    "normalized": normalize_chunk(group_pieces),
-                    "compactness": compactness,
-                    **classification
-                })
-                
-                # Found a good chunk at this size, stop looking for larger
-                break
-        
-        # Mark as used
+
+            group_pieces = [solution[i] for i in group_indices]
+            classification = classify_chunk(group_pieces, dims,
+                                            span=meta.span[group_indices])
+            chunks.append({
+                "indices": group_indices,
+                "pieces": group_pieces,
+                "dimensions": dims,
+                "normalized": normalize_chunk(group_pieces),
+                **extra,
+                **classification
+            })
+            accepted = group_indices
+            # Found a good chunk at this size, stop looking for larger
+            break
+
+        mark_used_fn(used_starts, start_idx, accepted)
+
+    return chunks
+
+
+def extract_3d_chunks(solution: List[List[Point3D]],
+                       min_pieces: int = 3,
+                       max_pieces: int = 4,
+                       meta: Optional[SolutionMeta] = None) -> List[Dict]:
+    """
+    Extract interesting 3D chunks from a solution.
+    Finds groups of 3-4 connected pieces that form compact 3D patterns.
+    Prefers chunks that fit within ~3x3x3 or similar compact regions.
+
+    Callers running several extractors over one solution should build its
+    SolutionMeta once and pass it in.
+    """
+    def accept(group_indices, dims):
+        # Prefer compact chunks: max dimension <= 4 for learning
+        max_dim = max(dims)
+        if max_dim > 4:
+            return None
+
+        # Density check: chunks should fill at least 40% of their bounding box
+        density = len(group_indices) * 4 / (dims[0] * dims[1] * dims[2])
+        if density < 0.4:
+            return None
+
+        # Require 3D structure (not flat)
+        if not (dims[2] > 1 and (dims[0] > 1 or dims[1] > 1)):
+            return None
+
+        # Score compactness: prefer smaller, denser chunks
+        return {"compactness": density * 10 - max_dim}
+
+    def mark_used(used_starts, start_idx, accepted):
         used_starts.add(start_idx)
-    
+
+    chunks = _extract_chunks_core(solution, meta, min_pieces,
+                                  range(min_pieces, max_pieces + 1),
+                                  accept, mark_used)
+
     # Sort by compactness (higher is better)
     chunks.sort(key=lambda x: -x.get("compactness", 0))
     return chunks[:10]  # Return top 10
 
 
-def extract_corner_chunks(solution: List[List[Point3D]]) -> List[Dict]:
+def extract_corner_chunks(solution: List[List[Point3D]],
+                          meta: Optional[SolutionMeta] = None) -> List[Dict]:
     """
     Extract chunks specifically near the corner (0,0,0).
     These are most useful for learning how to start the puzzle.
     """
+    if meta is None:
+        meta = SolutionMeta(solution)
+
     # Find pieces that touch or are near the corner
-    corner_pieces = []
-    for i, piece in enumerate(solution):
-        min_coords = piece_min_coords(piece)
-        if min_coords[0] <= 2 and min_coords[1] <= 2 and min_coords[2] <= 1:
-            corner_pieces.append(i)
-    
+    mc = meta.min_coords
+    corner_pieces = np.flatnonzero(
+        (mc[:, 0] <= 2) & (mc[:, 1] <= 2) & (mc[:, 2] <= 1)
+    ).tolist()
+
     if len(corner_pieces) < 3:
         return []
-    
+
     # Find connected groups within corner pieces
     chunks = []
     used = set()
-    
+    adjacency = meta.adjacency
+
     for start_idx in corner_pieces[:5]:  # Try first 5 corner pieces
         if start_idx in used:
             continue
         
         # Find connected pieces within corner region
         group = [start_idx]
-        queue = [start_idx]
-        visited = {start_idx}
-        
+        queue = deque([start_idx])
+        visited = np.zeros(len(solution), dtype=bool)
+        visited[start_idx] = True
+
         while queue and len(group) < 4:
-            current = queue.pop(0)
+            current = queue.popleft()
             for i in corner_pieces:
-                if i in visited:
+                if visited[i]:
                     continue
-                if are_pieces_adjacent(solution[current], solution[i]):
-                    visited.add(i)
+                if i in adjacency[current]:
+                    visited[i] = True
                     group.append(i)
                     queue.append(i)
                     if len(group) >= 4:
@@ -426,8 +710,9 @@ def extract_corner_chunks(solution: List[List[Point3D]]) -> List[Dict]:
         
         if len(group) >= 3:
             group_pieces = [solution[i] for i in group]
-            dims = get_chunk_dimensions(group_pieces)
-            classification = classify_chunk(group_pieces, dims)
+            dims = meta.chunk_dimensions(group)
+            classification = classify_chunk(group_pieces, dims,
+                                            span=meta.span[group])
             classification["type"] = "corner_start"
             classification["tip"] = "Start your puzzle with this corner pattern"
             
@@ -445,124 +730,162 @@ def extract_corner_chunks(solution: List[List[Point3D]]) -> List[Dict]:
     return chunks
 
 
-def extract_3d_chunks_original(solution: List[List[Point3D]], 
-                       min_pieces: int = 3, 
-                       max_pieces: int = 6) -> List[Dict]:
+def extract_3d_chunks_original(solution: List[List[Point3D]],
+                       min_pieces: int = 3,
+                       max_pieces: int = 6,
+                       meta: Optional[SolutionMeta] = None) -> List[Dict]:
     """
     Original extract function - kept for backwards compatibility.
+
+    Same pipeline as extract_3d_chunks, but with a looser volume-ratio
+    filter, a single target group size and an overlap policy that only
+    marks the first two group members as used.
     """
-    chunks = []
-    used_starts = set()
-    
-    for start_idx in range(len(solution)):
-        if start_idx in used_starts:
-            continue
-        
-        group_indices = find_connected_group(start_idx, solution, max_pieces)
-        
-        if len(group_indices) < min_pieces:
-            continue
-        
-        group_pieces = [solution[i] for i in group_indices]
-        dims = get_chunk_dimensions(group_pieces)
-        
-        max_dim = max(dims)
+    def accept(group_indices, dims):
         total_cells = len(group_indices) * 4
         volume = dims[0] * dims[1] * dims[2]
-        
+
         if volume > total_cells * 3:
-            continue
-        
-        if dims[2] > 1 or (dims[0] > 1 and dims[1] > 1):
-            classification = classify_chunk(group_pieces, dims)
-            
-            chunks.append({
-                "indices": group_indices,
-                "pieces": group_pieces,
-                "dimensions": dims,
-                "normalized": normalize_chunk(group_pieces),
-                **classification
-            })
-            
-            # Mark these as used to avoid too many overlapping chunks
-            for idx in group_indices[:2]:  # Only mark first 2 to allow overlap
-                used_starts.add(idx)
-    
-    return chunks
+            return None
+
+        if not (dims[2] > 1 or (dims[0] > 1 and dims[1] > 1)):
+            return None
 
+        return {}
 
-def extract_common_chunks(solutions: List[List[List[Point3D]]], 
-                          min_frequency: int = 2) -> List[Dict]:
+    def mark_used(used_starts, start_idx, accepted):
+        # Mark these as used to avoid too many overlapping chunks;
+        # only the first 2 so later starts may still overlap
+        if accepted is not None:
+            used_starts.update(accepted[:2])
+
+    return _extract_chunks_core(solution, meta, min_pieces,
+                                (max_pieces,), accept, mark_used)
+
+
+class PatternAccumulator:
+    """
+    Incremental chunk-pattern frequency tracker.
+
+    Folds solutions into chunk/corner frequency tables one at a time, so a
+    caller that already processed N solutions only pays for the new ones
+    (O(delta) instead of rescanning the whole corpus on every request).
+    """
+
+    def __init__(self):
+        # Counters over the flat bytes keys from normalize_chunk; the
+        # matching example chunk for each key is kept alongside
+        self.chunk_counts: Counter = Counter()
+        self.chunk_examples: Dict = {}
+        self.corner_counts: Counter = Counter()
+        self.corner_examples: Dict = {}
+        self.num_solutions = 0
+
+    def _fold(self, chunks: List[Dict], counts: Counter, examples: Dict) -> None:
+        """Count each distinct chunk key once for this solution."""
+        # A plain dict dedupes while keeping first-seen order, so the
+        # stored example stays the first chunk produced for each key
+        seen = {}
+        for chunk in chunks:
+            seen.setdefault(chunk["normalized"], chunk)
+        counts.update(seen.keys())
+        for key, chunk in seen.items():
+            examples.setdefault(key, chunk)
+
+    def update(self, new_solutions: List[List[List[Point3D]]]) -> None:
+        """Fold new solutions into the frequency tables."""
+        for solution in new_solutions:
+            # Shared per-solution geometry for both extraction passes
+            meta = SolutionMeta(solution)
+
+            self._fold(extract_3d_chunks(solution, meta=meta),
+                       self.chunk_counts, self.chunk_examples)
+            self._fold(extract_corner_chunks(solution, meta=meta),
+                       self.corner_counts, self.corner_examples)
+
+            self.num_solutions += 1
+
+    def build_patterns(self, min_frequency: int = 2) -> List[Dict]:
+        """Build the common-pattern list from the current frequency tables."""
+        # Build result: corner patterns first (most useful), then general
+        common = []
+
+        # Add best corner pattern first
+        for key, count in self.corner_counts.most_common():
+            if count >= min_frequency and len(common) < 2:
+                example = self.corner_examples[key]
+                dims = example["dimensions"]
+                common.append({
+                    "id": f"corner_{len(common)+1}",
+                    "name": f"Corner Start ({dims[0]}×{dims[1]}×{dims[2]})",
+                    "description": f"{example['num_pieces']} pieces at corner, in {count} solutions",
+                    "pieces": example["pieces"],
+                    "frequency": count,
+                    "difficulty": "easy",
+                    "tip": "Start your puzzle from the corner with these pieces",
+                    "dimensions": dims
+                })
+
+        # Add compact 3D chunks
+        for key, count in self.chunk_counts.most_common():
+            if count >= min_frequency and len(common) < 8:
+                example = self.chunk_examples[key]
+                dims = example["dimensions"]
+
+                common.append({
+                    "id": f"chunk_{len(common)+1}",
+                    "name": f"{example['type'].replace('_', ' ').title()} ({dims[0]}×{dims[1]}×{dims[2]})",
+                    "description": f"{example['num_pieces']} pieces, appears in {count} solutions",
+                    "pieces": example["pieces"],
+                    "frequency": count,
+                    "difficulty": example["difficulty"],
+                    "tip": example["tip"],
+                    "dimensions": dims
+                })
+
+        return common
+
+
+def extract_common_chunks(solutions: List[List[List[Point3D]]],
+                          min_frequency: int = 2,
+                          early_stop_count: int = 8) -> List[Dict]:
     """
     Analyze multiple solutions to find common 3D chunk patterns.
     Includes both general chunks and corner-specific patterns.
+
+    Solutions are folded in one at a time and the scan stops early once
+    early_stop_count patterns have reached min_frequency - build_patterns
+    returns at most 8 anyway, so on large corpora where the first few
+    solutions already repeat the same chunks the rest are never
+    extracted. Pass early_stop_count=None to always scan everything.
     """
-    chunk_counts = defaultdict(int)
-    chunk_examples = {}
-    corner_counts = defaultdict(int)
-    corner_examples = {}
-    
+    accumulator = PatternAccumulator()
     for solution in solutions:
-        # Regular compact chunks
-        chunks = extract_3d_chunks(solution)
-        seen_in_solution = set()
-        
-        for chunk in chunks:
-            key = chunk["normalized"]
-            if key not in seen_in_solution:
-                chunk_counts[key] += 1
-                seen_in_solution.add(key)
-                if key not in chunk_examples:
-                    chunk_examples[key] = chunk
-        
-        # Corner chunks (for learning to start)
-        corner_chunks = extract_corner_chunks(solution)
-        corner_seen = set()
-        for chunk in corner_chunks:
-            key = chunk["normalized"]
-            if key not in corner_seen:
-                corner_counts[key] += 1
-                corner_seen.add(key)
-                if key not in corner_examples:
-                    corner_examples[key] = chunk
-    
-    # Build result: corner patterns first (most useful), then general
-    common = []
-    
-    # Add best corner pattern first
-    for key, count in sorted(corner_counts.items(), key=lambda x: -x[1]):
-        if count >= min_frequency and len(common) < 2:
-            example = corner_examples[key]
-            dims = example["dimensions"]
-            common.append({
-                "id": f"corner_{len(common)+1}",
-                "name": f"Corner Start ({dims[0]}×{dims[1]}×{dims[2]})",
-                "description": f"{example['num_pieces']} pieces at corner, in {count} solutions",
-                "pieces": example["pieces"],
-                "frequency": count,
-                "difficulty": "easy",
-                "tip": "Start your puzzle from the corner with these pieces",
-                "dimensions": dims
-            })
-    
-    # Add compact 3D chunks
-    for key, count in sorted(chunk_counts.items(), key=lambda x: -x[1]):
-        if count >= min_frequency and len(common) < 8:
-            example = chunk_examples[key]
-            dims = example["dimensions"]
-            
-            common.append({
-                "id": f"chunk_{len(common)+1}",
-                "name": f"{example['type'].replace('_', ' ').title()} ({dims[0]}×{dims[1]}×{dims[2]})",
-                "description": f"{example['num_pieces']} pieces, appears in {count} solutions",
-                "pieces": example["pieces"],
-                "frequency": count,
-                "difficulty": example["difficulty"],
-                "tip": example["tip"],
-                "dimensions": dims
-            })
-    
-    return common
+        accumulator.update([solution])
+        if early_stop_count is not None:
+            qualified = (
+                sum(1 for c in accumulator.corner_counts.values()
+                    if c >= min_frequency)
+                + sum(1 for c in accumulator.chunk_counts.values()
+                      if c >= min_frequency)
+            )
+            if qualified >= early_stop_count:
+                break
+    return accumulator.build_patterns(min_frequency)
+
+
+def get_all_patterns_incremental(accumulator: PatternAccumulator,
+                                 min_frequency: int = 2) -> List[Dict]:
+    """
+    Same fallback policy as get_all_patterns, but fed from an accumulator
+    that the caller keeps up to date incrementally.
+    """
+    if accumulator.num_solutions >= 3:
+        common = accumulator.build_patterns(min_frequency)
+        if len(common) >= 4:
+            return common
+
+    return FALLBACK_PATTERNS
 
 
 # =============================================================================
@@ -684,31 +1007,56 @@ def generate_tutorial_steps(ordered_pieces: List[List[Point3D]]) -> List[Dict]:
     """
     Generate tutorial step data for each piece placement.
     """
+    if not ordered_pieces:
+        return []
+
+    n = len(ordered_pieces)
+
+    # Tuple-ify each piece's cells once, up front
+    all_piece_tuples = [[tuple(p) for p in piece] for piece in ordered_pieces]
+
+    # Per-piece stats in one vectorized pass over the stacked coordinates
+    arr = np.asarray(ordered_pieces, dtype=np.int16)
+    min_z_arr = arr[:, :, 2].min(axis=1)
+    grounded_arr = min_z_arr == 0
+    sq = arr.astype(np.int32)
+    corner_dist_arr = np.sqrt((sq * sq).sum(axis=2).min(axis=1))
+
+    # Linear cell indices per piece, and bounds-clipped neighbor indices
+    # as a CSR over pieces (same layout as the ordering kernel's)
+    cell_idx = (arr[:, :, 0]
+                + arr[:, :, 1] * CUBE_SIZE
+                + arr[:, :, 2] * CUBE_SIZE * CUBE_SIZE).astype(np.int32)
+    nbr_flat: List[int] = []
+    nbr_ptr = np.zeros(n + 1, dtype=np.int32)
+    for i, piece_tuples in enumerate(all_piece_tuples):
+        for x, y, z in piece_tuples:
+            idx = point_to_index(x, y, z)
+            for (dx, dy, dz), delta in zip(NEIGHBOR_OFFSETS, NEIGHBOR_IDX_DELTAS):
+                if is_in_bounds(x + dx, y + dy, z + dz):
+                    nbr_flat.append(idx + delta)
+        nbr_ptr[i + 1] = len(nbr_flat)
+    nbr_idx = np.array(nbr_flat, dtype=np.int32)
+
+    # Owner of every placed cell, filled as pieces are placed, so each
+    # step's adjacency is one gather over its neighbor indices instead
+    # of a rescan of all earlier pieces
+    owner = np.full(CUBE_SIZE ** 3, -1, dtype=np.int16)
+    placed_mask = 0
     steps = []
-    placed_cells: Set[Point3D] = set()
-    
-    for i, piece in enumerate(ordered_pieces):
-        piece_tuples = [tuple(p) for p in piece]
-        
-        # Analyze this piece
-        min_z = get_piece_min_z(piece_tuples)
-        is_grounded = min_z == 0
-        corner_dist = piece_corner_distance(piece_tuples)
-        
+
+    for i, piece_tuples in enumerate(all_piece_tuples):
+        min_z = int(min_z_arr[i])
+        is_grounded = bool(grounded_arr[i])
+        corner_dist = float(corner_dist_arr[i])
+
         # Find adjacent pieces (which pieces it touches)
-        adjacent_pieces = set()
-        for x, y, z in piece_tuples:
-            for dx, dy, dz in [(1,0,0), (-1,0,0), (0,1,0), (0,-1,0), (0,0,1), (0,0,-1)]:
-                neighbor = (x+dx, y+dy, z+dz)
-                if neighbor in placed_cells:
-                    for j, prev_piece in enumerate(ordered_pieces[:i]):
-                        if neighbor in [tuple(p) for p in prev_piece]:
-                            adjacent_pieces.add(j + 1)
-                            break
-        
-        # Check accessibility 
-        accessible = is_piece_accessible(piece_tuples, placed_cells) if placed_cells else True
-        
+        owners = owner[nbr_idx[nbr_ptr[i]:nbr_ptr[i + 1]]]
+        adjacent_pieces = sorted({int(j) + 1 for j in owners[owners >= 0]})
+
+        # Check accessibility
+        accessible = is_piece_accessible(piece_tuples, placed_mask) if placed_mask else True
+
         # Generate tip based on context
         if i == 0:
             tip = "Start at the corner (0,0,0) with a flat piece for stability."
@@ -717,48 +1065,65 @@ def generate_tutorial_steps(ordered_pieces: List[List[Point3D]]) -> List[Dict]:
         elif is_grounded:
             tip = "Ground level piece - stable foundation."
         elif len(adjacent_pieces) > 0:
-            adj_list = sorted(adjacent_pieces)
-            tip = f"Layer z={min_z}: Connects to piece(s) {adj_list}."
+            tip = f"Layer z={min_z}: Connects to piece(s) {adjacent_pieces}."
         else:
             tip = f"Layer z={min_z}: Place carefully on the layer below."
-        
+
         step = {
             "step": i + 1,
-            "total_steps": len(ordered_pieces),
+            "total_steps": n,
             "piece_index": i,
             "cells": [[x, y, z] for x, y, z in piece_tuples],
             "is_grounded": is_grounded,
             "z_level": min_z,
             "corner_distance": round(corner_dist, 2),
-            "adjacent_to": sorted(adjacent_pieces),
+            "adjacent_to": adjacent_pieces,
             "accessible": accessible,
             "tip": tip,
         }
         steps.append(step)
-        
-        # Add to placed cells
-        for cell in piece_tuples:
-            placed_cells.add(cell)
-    
+
+        # Record this piece as owner of its cells
+        owner[cell_idx[i]] = i
+        placed_mask |= cells_to_mask(piece_tuples)
+
     return steps
 
 
+# Orientation codes for the vectorized tally below, in the same order
+# as the tests in get_piece_orientation
+_ORIENTATION_NAMES = ("flat", "wall_xz", "wall_yz", "3d")
+
+
 def analyze_solution_patterns(pieces: List[List[Point3D]]) -> Dict:
     """
     Analyze a solution for statistics.
+
+    Runs as two np.bincount reductions over a (54, 4, 3) coordinate
+    array instead of a Python loop over pieces: layers come from the
+    per-piece min z, orientations from which axes vary within a piece
+    (an axis is constant iff its min equals its max).
     """
-    by_layer = defaultdict(int)
-    orientations = defaultdict(int)
-    
-    for piece in pieces:
-        min_z = get_piece_min_z(piece)
-        by_layer[min_z] += 1
-        orientations[get_piece_orientation(piece)] += 1
-    
+    coords = np.asarray(pieces, dtype=np.int64)
+    if coords.size == 0:
+        return {"total_pieces": 0, "by_layer": {}, "orientations": {}}
+
+    min_z = coords[:, :, 2].min(axis=1)
+    layer_counts = np.bincount(min_z, minlength=CUBE_SIZE)
+
+    # (num_pieces, 3) bools: does the piece extend along x / y / z?
+    varies = coords.max(axis=1) != coords.min(axis=1)
+    codes = np.where(~varies[:, 2], 0,
+                     np.where(~varies[:, 1], 1,
+                              np.where(~varies[:, 0], 2, 3)))
+    orient_counts = np.bincount(codes, minlength=4)
+
     return {
         "total_pieces": len(pieces),
-        "by_layer": dict(by_layer),
-        "orientations": dict(orientations)
+        "by_layer": {z: int(c) for z, c in enumerate(layer_counts) if c},
+        "orientations": {
+            name: int(c) for name, c in zip(_ORIENTATION_NAMES, orient_counts) if c
+        }
     }
 
 
@@ -18,6 +18,7 @@ We use a linear index: cell_id = x + y*6 + z*36
 This maps (x,y,z) ∈ [0,5]³ → [0,215]
 """
 
+import numpy as np
 from typing import List, Tuple, Set
 from .geometry import get_orientations, Point3D
 
@@ -96,46 +97,46 @@ def translate_piece(piece: List[Point3D], dx: int, dy: int, dz: int) -> List[Poi
     return [(x + dx, y + dy, z + dz) for x, y, z in piece]
 
 
-def generate_all_placements() -> List[Placement]:
+def generate_all_placements() -> np.ndarray:
     """
     Generate all legal placements of T-tetracubes in the 6×6×6 cube.
-    
+
     Algorithm:
     1. For each unique orientation of the T-piece
     2. For each translation (dx, dy, dz) in [0, 5]³
     3. If all cells are in bounds, record the placement
-    
+
+    Per orientation the whole translation grid is built by broadcasting:
+    the (dx, dy, dz) grid from np.meshgrid is added to the (4, 3)
+    orientation in one shot and mapped to sorted cell indices with a
+    vectorized dot against the index weights - a handful of array ops
+    instead of ~1440 interpreted loop bodies. Ordering matches the old
+    nested dx/dy/dz loops ('ij' indexing) and dedup keeps the first
+    occurrence, so placement row ids are unchanged.
+
     Returns:
-        List of placements, where each placement is a tuple of 4 cell indices
+        Contiguous (num_placements, 4) uint8 array of sorted cell indices
     """
     orientations = get_orientations()
-    placements: List[Placement] = []
-    placement_set: Set[Placement] = set()  # For deduplication (shouldn't be needed but safety)
-    
+    weights = np.array([1, CUBE_SIZE, CUBE_SIZE * CUBE_SIZE], dtype=np.int16)
+
+    blocks = []
     for orientation in orientations:
-        # Compute the bounding box of this orientation
-        max_x = max(p[0] for p in orientation)
-        max_y = max(p[1] for p in orientation)
-        max_z = max(p[2] for p in orientation)
-        
+        orient = np.asarray(orientation, dtype=np.int16)
+        maxs = orient.max(axis=0)
+
         # Valid translation ranges (since orientation is normalized to start at 0)
-        for dx in range(CUBE_SIZE - max_x):
-            for dy in range(CUBE_SIZE - max_y):
-                for dz in range(CUBE_SIZE - max_z):
-                    translated = translate_piece(orientation, dx, dy, dz)
-                    
-                    # Double-check bounds (should always pass given our ranges)
-                    if is_placement_valid(translated):
-                        # Convert to cell indices
-                        indices = tuple(sorted(
-                            point_to_index(x, y, z) for x, y, z in translated
-                        ))
-                        
-                        if indices not in placement_set:
-                            placement_set.add(indices)
-                            placements.append(indices)
-    
-    return placements
+        ranges = [np.arange(CUBE_SIZE - m, dtype=np.int16) for m in maxs]
+        grid = np.stack(np.meshgrid(*ranges, indexing='ij'), axis=-1).reshape(-1, 1, 3)
+
+        translated = orient[None, :, :] + grid
+        blocks.append(np.sort(translated @ weights, axis=1))
+
+    stacked = np.vstack(blocks)
+
+    # Dedup (shouldn't be needed but safety), keeping first occurrence
+    _, first = np.unique(stacked, axis=0, return_index=True)
+    return np.ascontiguousarray(stacked[np.sort(first)].astype(np.uint8))
 
 
 def get_placement_coordinates(placement: Placement) -> List[Point3D]:
@@ -147,8 +148,50 @@ def get_placement_coordinates(placement: Placement) -> List[Point3D]:
 # MODULE-LEVEL CACHED DATA
 # =============================================================================
 
-# Cache all placements at module load time
-ALL_PLACEMENTS: List[Placement] = generate_all_placements()
+# The canonical placement store: a contiguous (num_placements, 4) uint8
+# array of packed cell indices, so a whole solution converts with one
+# fancy-index gather and downstream compiled code reads it directly
+ALL_PLACEMENTS_ARR: np.ndarray = generate_all_placements()
+
+# Thin tuple view for callers that key dicts/sets by placements or use
+# `cell in placement` membership; same rows, same order
+ALL_PLACEMENTS: List[Placement] = [
+    tuple(int(c) for c in row) for row in ALL_PLACEMENTS_ARR
+]
+
+# Decode table: INDEX_TO_POINT_ARR[cell_index] = (x, y, z), letting any
+# array of cell indices decode to coordinates in one gather
+INDEX_TO_POINT_ARR: np.ndarray = np.stack(
+    [np.arange(NUM_CELLS) % CUBE_SIZE,
+     (np.arange(NUM_CELLS) // CUBE_SIZE) % CUBE_SIZE,
+     np.arange(NUM_CELLS) // (CUBE_SIZE * CUBE_SIZE)],
+    axis=-1
+).astype(np.int8)
+
+
+def _build_cell_priority() -> np.ndarray:
+    """
+    Per-cell constrainedness rank: summed distance to the nearest faces.
+
+    For each axis the distance to the closer face is 0..2; the rank is
+    the sum over the three axes, so corners rank 0, edges/faces next and
+    center cells last. Boundary cells admit the fewest placements
+    throughout the search, so the DLX column chooser uses this rank to
+    break MRV ties toward them instead of taking header order.
+    """
+    idx = np.arange(NUM_CELLS)
+    x = idx % CUBE_SIZE
+    y = (idx // CUBE_SIZE) % CUBE_SIZE
+    z = idx // (CUBE_SIZE * CUBE_SIZE)
+
+    def face_dist(v: np.ndarray) -> np.ndarray:
+        return np.minimum(v, CUBE_SIZE - 1 - v)
+
+    return (face_dist(x) + face_dist(y) + face_dist(z)).astype(np.int32)
+
+
+# Tie-break ranking for the MRV column choice, indexed by cell index
+CELL_PRIORITY: np.ndarray = _build_cell_priority()
 
 
 def get_placements() -> List[Placement]:
@@ -156,6 +199,11 @@ def get_placements() -> List[Placement]:
     return ALL_PLACEMENTS
 
 
+def get_placements_array() -> np.ndarray:
+    """Get all legal placements as the packed (num_placements, 4) array."""
+    return ALL_PLACEMENTS_ARR
+
+
 # =============================================================================
 # VERIFICATION / TESTING
 # =============================================================================
@@ -193,7 +241,14 @@ def verify_placements() -> None:
         reconstructed = point_to_index(*point)
         assert reconstructed == idx, f"Index conversion failed for {idx}"
     print("✓ Index conversion is bijective")
-    
+
+    # Verify cell priority ranking: corners most constrained, center least
+    assert CELL_PRIORITY[point_to_index(0, 0, 0)] == 0, "Corner should rank first"
+    assert CELL_PRIORITY[point_to_index(5, 5, 5)] == 0, "Corner should rank first"
+    assert CELL_PRIORITY[point_to_index(2, 3, 2)] == 6, "Center should rank last"
+    assert CELL_PRIORITY.min() == 0 and CELL_PRIORITY.max() == 6
+    print("✓ Cell priority ranks corners before center cells")
+
     # Show some example placements
     print(f"\nExample placements (first 5):")
     for i, placement in enumerate(placements[:5]):
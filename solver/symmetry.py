@@ -22,14 +22,29 @@ We transform by: translate to origin, rotate, translate back.
 
 import numpy as np
 from typing import List, Tuple, Set, FrozenSet
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 from .geometry import get_rotation_matrices, Point3D
-from .placements import CUBE_SIZE, point_to_index, index_to_point, get_placement_coordinates
+from .placements import (
+    CUBE_SIZE,
+    point_to_index,
+    index_to_point,
+    get_placement_coordinates,
+    ALL_PLACEMENTS,
+    ALL_PLACEMENTS_ARR,
+    INDEX_TO_POINT_ARR,
+)
+from ._canon_numba import _canonical_owner_key, _canonical_owner_keys_batch
 
 # Type for a solution: tuple of placement indices (row IDs)
 Solution = Tuple[int, ...]
 
-# Type for a canonical solution: sorted tuple of sorted pieces
-CanonicalSolution = Tuple[Tuple[Point3D, ...], ...]
+# Type for a canonical solution: 216 bytes - the sorted concatenation
+# of each piece's 4 sorted cell indices (every index fits in one byte)
+CanonicalSolution = bytes
 
 
 # =============================================================================
@@ -40,38 +55,36 @@ def rotate_point_in_cube(point: Point3D, rotation: np.ndarray) -> Point3D:
     """
     Rotate a point within the 6×6×6 cube.
     
-    The rotation is performed around the cube center (2.5, 2.5, 2.5).
-    
-    Process:
-    1. Translate point to center origin: p' = p - (2.5, 2.5, 2.5)
-    2. Apply rotation: p'' = R @ p'
-    3. Translate back: p''' = p'' + (2.5, 2.5, 2.5)
-    4. Round to integers (rotation by 90° keeps lattice points on lattice)
-    
+    The rotation is performed around the cube center (2.5, 2.5, 2.5),
+    conceptually: translate to the center, apply R, translate back.
+
+    The arithmetic stays in pure Python ints by working in doubled
+    coordinates: u = 2x - 5 maps [0, 5] onto the odd lattice
+    {-5, -3, -1, 1, 3, 5} centered at the origin, where every rotation
+    matrix entry is -1, 0 or 1, so R applies as nine integer
+    multiply-adds and the result maps back with (u + 5) // 2. No array
+    construction, no matmul dispatch, no float rounding - the exactness
+    that round() used to paper over is now structural.
+
     Args:
         point: (x, y, z) coordinates in [0, 5]
-        rotation: 3×3 rotation matrix
-    
+        rotation: 3×3 rotation matrix with entries in {-1, 0, 1}
+
     Returns:
         Rotated point coordinates
     """
-    center = 2.5  # Center of 6×6×6 cube
-    
-    # Convert to centered coordinates
-    p = np.array([point[0] - center, point[1] - center, point[2] - center])
-    
-    # Apply rotation
-    rotated = rotation @ p
-    
-    # Convert back to cube coordinates
-    result = rotated + center
-    
-    # Round to nearest integer (should be exact for 90° rotations)
-    x = int(round(result[0]))
-    y = int(round(result[1]))
-    z = int(round(result[2]))
-    
-    return (x, y, z)
+    (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = (
+        rotation.tolist() if isinstance(rotation, np.ndarray) else rotation
+    )
+
+    # Doubled, centered coordinates (odd integers in [-5, 5])
+    u = 2 * point[0] - 5
+    v = 2 * point[1] - 5
+    w = 2 * point[2] - 5
+
+    return ((r00 * u + r01 * v + r02 * w + 5) // 2,
+            (r10 * u + r11 * v + r12 * w + 5) // 2,
+            (r20 * u + r21 * v + r22 * w + 5) // 2)
 
 
 def rotate_piece_in_cube(piece_coords: List[Point3D], rotation: np.ndarray) -> List[Point3D]:
@@ -109,53 +122,256 @@ def rotate_solution(solution_pieces: List[List[Point3D]], rotation: np.ndarray)
 def solution_to_canonical_key(solution_pieces: List[List[Point3D]]) -> CanonicalSolution:
     """
     Convert a solution to a canonical comparable form.
-    
-    The key is a tuple of sorted pieces, where each piece is a sorted tuple
-    of coordinates. This allows lexicographic comparison.
-    
+
+    Each piece becomes 4 bytes of sorted packed cell indices, the piece
+    byte strings are sorted, and the key is their concatenation - one
+    216-byte object whose comparison and hashing are single memcmp-style
+    passes instead of hundreds of per-int compares, carrying the same
+    information (point_to_index is bijective and every index fits in a
+    byte).
+
     Args:
         solution_pieces: List of pieces (each piece is list of coordinates)
-    
+
     Returns:
-        Canonical form as nested tuples
+        Canonical form as flat bytes
     """
-    # Sort coordinates within each piece, then sort pieces
-    sorted_pieces = [tuple(sorted(piece)) for piece in solution_pieces]
-    return tuple(sorted(sorted_pieces))
+    cells = coords_to_cells(solution_pieces)
+    return b''.join(sorted(bytes(sorted(piece.tolist())) for piece in cells))
 
 
 def compute_canonical_form(solution_pieces: List[List[Point3D]]) -> CanonicalSolution:
     """
     Compute the canonical form of a solution under cube rotations.
-    
+
     Mathematical correctness:
     - Apply all 24 rotations to the solution
     - Compute the canonical key for each rotated version
     - Return the lexicographically smallest key
-    
+
     This defines an equivalence relation where two solutions are equivalent
     iff their canonical forms are equal.
-    
+
+    All 24 rotations are applied as one gather through the precomputed
+    ROT table, but only a surviving coset gets the full key build. A
+    key's first piece is always the piece containing the smallest
+    rotated cell (pieces are disjoint, so exactly one holds it), and
+    its 4 sorted bytes open the key; any rotation whose first piece is
+    lex-greater than the best first piece can never produce the overall
+    minimum. Finding each rotation's first piece costs one argmin and
+    one 4-element sort, so the 54-piece sort + join runs only for the
+    few rotations - usually just the stabilizer coset of the winning
+    corner piece - that remain tied after the prefilter.
+
     Args:
         solution_pieces: List of pieces (each piece is list of coordinates)
-    
+
     Returns:
         Canonical form (lexicographically smallest under rotations)
     """
-    rotations = get_rotation_matrices()
-    
+    cells = coords_to_cells(solution_pieces).astype(np.intp)
+
+    # All rotated images at once: (24, num_pieces, 4)
+    rotated_all = ROT[:, cells]
+
+    # First piece per rotation: the piece holding the minimal cell
+    flat = rotated_all.reshape(len(ROT), -1)
+    first_piece = flat.argmin(axis=1) // cells.shape[1]
+    first_keys = [bytes(sorted(rotated_all[r, p].tolist()))
+                  for r, p in enumerate(first_piece)]
+    best_first = min(first_keys)
+
     min_key = None
-    
-    for R in rotations:
-        rotated = rotate_solution(solution_pieces, R)
-        key = solution_to_canonical_key(rotated)
-        
+    for r, first in enumerate(first_keys):
+        if first != best_first:
+            continue
+        key = b''.join(sorted(bytes(sorted(piece.tolist()))
+                              for piece in rotated_all[r]))
         if min_key is None or key < min_key:
             min_key = key
-    
+
     return min_key
 
 
+# =============================================================================
+# CELL-INDEX ROTATION TABLES
+# =============================================================================
+
+def _build_rotation_table() -> np.ndarray:
+    """
+    Build the 24 cube rotations as a flat cell-index lookup table.
+
+    ROT[r, old_index] = new_index: applying rotation r to a placement
+    (tuple of cell indices) is a direct gather, with the matrix multiply
+    and rounding paid once at import for all 24 x 216 cases.
+    """
+    rotations = get_rotation_matrices()
+    num_cells = CUBE_SIZE ** 3
+    rot = np.empty((len(rotations), num_cells), dtype=np.int16)
+
+    for r, R in enumerate(rotations):
+        for idx in range(num_cells):
+            rot[r, idx] = point_to_index(*rotate_point_in_cube(index_to_point(idx), R))
+
+    return rot
+
+
+ROT: np.ndarray = _build_rotation_table()
+
+
+def _invert_perms(rot: np.ndarray) -> np.ndarray:
+    """
+    Invert each rotation's cell permutation.
+
+    PERM[r, new_index] = old_index, so that for an occupancy array `a`
+    indexed by cell, `a[PERM[r]]` is the occupancy of the rotated cube.
+    """
+    perms = np.empty_like(rot)
+    identity = np.arange(rot.shape[1], dtype=rot.dtype)
+    for r in range(rot.shape[0]):
+        perms[r, rot[r]] = identity
+    return perms
+
+
+ROTATION_PERMS: np.ndarray = _invert_perms(ROT)
+
+
+def _build_rotated_placement_table() -> np.ndarray:
+    """
+    Map (rotation, placement id) to the id of the rotated placement.
+
+    Rotations send legal placements to legal placements (they map the
+    cube onto itself), so each ROT row induces a permutation of the
+    placement table. With RP in hand, rotating a whole solution of 54
+    row ids is a single gather - per-piece granularity instead of
+    per-cell.
+    """
+    placement_id = {p: i for i, p in enumerate(ALL_PLACEMENTS)}
+    cells = ALL_PLACEMENTS_ARR.astype(np.intp)
+
+    rp = np.empty((len(ROT), len(ALL_PLACEMENTS)), dtype=np.int32)
+    for r, rot in enumerate(ROT):
+        rotated = np.sort(rot[cells], axis=1)
+        for i, row in enumerate(rotated):
+            rp[r, i] = placement_id[tuple(int(c) for c in row)]
+    return rp
+
+
+RP: np.ndarray = _build_rotated_placement_table()
+
+
+def compute_canonical_form_rows(solution_rows: List[int]) -> bytes:
+    """
+    Canonical form of a solution given as placement row ids.
+
+    All 24 rotated row-id multisets come from one RP gather and one
+    sort; the key is the lexicographically smallest row encoded as
+    big-endian int16 bytes (so byte order equals numeric order). Same
+    equivalence relation as compute_canonical_form at a quarter of the
+    elements per comparison - placements instead of cells.
+
+    Args:
+        solution_rows: Placement indices into ALL_PLACEMENTS
+
+    Returns:
+        108-byte canonical key (54 big-endian int16 row ids)
+    """
+    rows = np.asarray(solution_rows, dtype=np.intp)
+    rotated = np.sort(RP[:, rows], axis=1).astype('>i2')
+    return min(r.tobytes() for r in rotated)
+
+# Sentinel for cells not covered by any piece (partial solutions)
+_NO_PIECE = 255
+
+
+# =============================================================================
+# PACKED CELL-INDEX REPRESENTATION
+# =============================================================================
+#
+# Solutions are stored as uint8 arrays of shape (num_pieces, 4) holding
+# packed cell indices (x + y*6 + z*36, each in [0, 216)). One piece is
+# 4 bytes and one full solution 216 bytes, instead of hundreds of Python
+# int/tuple objects. Coordinates are decoded only at output boundaries.
+
+def coords_to_cells(solution_pieces: List[List[Point3D]]) -> np.ndarray:
+    """
+    Pack a coordinate-form solution into a (num_pieces, 4) uint8 cell array.
+
+    Args:
+        solution_pieces: List of pieces (each piece is list of coordinates)
+
+    Returns:
+        uint8 array of packed cell indices
+    """
+    return np.array(
+        [[point_to_index(x, y, z) for x, y, z in piece] for piece in solution_pieces],
+        dtype=np.uint8
+    )
+
+
+def cells_to_coords(cells: np.ndarray) -> np.ndarray:
+    """
+    Decode packed cell indices back to (x, y, z) coordinates.
+
+    The inverse of point_to_index (index = x + y*6 + z*36): one gather
+    through the precomputed INDEX_TO_POINT_ARR decode table instead of
+    per-cell Python arithmetic.
+
+    Args:
+        cells: Array of packed cell indices (any shape)
+
+    Returns:
+        int8 array with a trailing axis of length 3 holding (x, y, z)
+    """
+    return INDEX_TO_POINT_ARR[np.asarray(cells)]
+
+
+def solution_fingerprint(solution_cells: np.ndarray) -> bytes:
+    """
+    Compute a canonical 216-byte fingerprint of a solution.
+
+    The solution is encoded as a per-cell piece-id array; each of the 24
+    rotations is applied as a single NumPy gather, piece ids are relabeled
+    in order of first appearance (so the arbitrary piece numbering cannot
+    affect the key), and the lexicographically smallest byte string wins.
+
+    Two solutions get the same fingerprint iff they induce the same
+    partition of cells into pieces up to cube rotation - the same
+    equivalence as compute_canonical_form, at a fraction of the cost.
+
+    The whole 24-rotation scan (gather, relabel, lexicographic minimum)
+    runs in the compiled kernel from _canon_numba, so per-solution work
+    in the solve loop stays out of the interpreter.
+
+    Args:
+        solution_cells: (num_pieces, 4) array of packed cell indices
+    """
+    cells = np.ascontiguousarray(solution_cells, dtype=np.int16)
+    return _canonical_owner_key(cells, ROTATION_PERMS).tobytes()
+
+
+def solution_fingerprints(cells_batch: np.ndarray) -> List[bytes]:
+    """
+    Canonical fingerprints for a batch of solutions at once.
+
+    The compiled batch kernel fans the solutions out over threads (one
+    per solution - the 24 rotations inside a single fingerprint are too
+    quick to be worth a thread launch), so callers draining batches of
+    raw solutions from the DLX kernel should prefer this over per-
+    solution solution_fingerprint calls.
+
+    Args:
+        cells_batch: (num_solutions, num_pieces, 4) packed cell indices
+
+    Returns:
+        One 216-byte key per solution, in input order
+    """
+    batch = np.ascontiguousarray(cells_batch, dtype=np.int16)
+    if batch.shape[0] == 0:
+        return []
+    return [key.tobytes() for key in _canonical_owner_keys_batch(batch, ROTATION_PERMS)]
+
+
 # =============================================================================
 # SOLUTION MANAGEMENT
 # =============================================================================
@@ -168,54 +384,106 @@ class SolutionSet:
     deduplicated.
     """
     
-    def __init__(self):
-        self.canonical_forms: Set[CanonicalSolution] = set()
-        self.solutions: List[List[List[Point3D]]] = []  # Store one representative
-    
-    def add(self, solution_pieces: List[List[Point3D]]) -> bool:
+    def __init__(self, keep_representatives: bool = True):
+        """
+        Args:
+            keep_representatives: If False, only the dedup digests are
+                retained and `solutions` stays empty - for counting-only
+                runs where the representatives would dominate memory.
+        """
+        # 16-byte xxh3 digests of the 216-byte canonical fingerprints
+        # (the raw keys when xxhash is unavailable); a digest set costs a
+        # fraction of the keys it replaces and collisions are negligible
+        # at any reachable solution count
+        self._seen: Set[bytes] = set()
+        self.keep_representatives = keep_representatives
+        # One representative per class, stored as a packed (54, 4) uint8
+        # cell-index array - 216 bytes per solution; decode with
+        # cells_to_coords at output boundaries
+        self.solutions: List[np.ndarray] = []
+
+    @staticmethod
+    def _digest(key: bytes) -> bytes:
+        """Compress a canonical key for set storage."""
+        if xxhash is not None:
+            return xxhash.xxh3_128_digest(key)
+        return key
+
+    def add(self, solution_cells: np.ndarray) -> bool:
         """
         Add a solution if it's not equivalent to an existing one.
-        
+
         Args:
-            solution_pieces: List of pieces (each piece is list of coordinates)
-        
+            solution_cells: (num_pieces, 4) array of packed cell indices
+
         Returns:
             True if this is a new solution, False if equivalent exists
         """
-        canonical = compute_canonical_form(solution_pieces)
-        
-        if canonical in self.canonical_forms:
+        digest = self._digest(solution_fingerprint(solution_cells))
+
+        if digest in self._seen:
             return False
-        
-        self.canonical_forms.add(canonical)
-        self.solutions.append(solution_pieces)
+
+        self._seen.add(digest)
+        if self.keep_representatives:
+            self.solutions.append(np.asarray(solution_cells, dtype=np.uint8))
         return True
-    
+
+    def add_batch(self, cells_batch: np.ndarray) -> List[bool]:
+        """
+        Add a batch of solutions, fingerprinting them in parallel.
+
+        Keys are computed together by the threaded batch kernel; the
+        dedup pass itself stays serial (and ordered), so the result is
+        exactly what per-solution add calls would have produced.
+
+        Args:
+            cells_batch: (num_solutions, num_pieces, 4) packed cell indices
+
+        Returns:
+            One flag per solution: True if it was new
+        """
+        added = []
+        for key, cells in zip(solution_fingerprints(cells_batch), cells_batch):
+            digest = self._digest(key)
+            if digest in self._seen:
+                added.append(False)
+            else:
+                self._seen.add(digest)
+                if self.keep_representatives:
+                    self.solutions.append(np.asarray(cells, dtype=np.uint8))
+                added.append(True)
+        return added
+
     def __len__(self) -> int:
-        return len(self.canonical_forms)
+        return len(self._seen)
     
     def __iter__(self):
         return iter(self.solutions)
 
 
-def placements_to_pieces(placement_indices: List[int], 
-                         all_placements: List[Tuple[int, ...]]) -> List[List[Point3D]]:
+def placements_to_pieces(placement_indices: List[int],
+                         all_placements: List[Tuple[int, ...]]) -> np.ndarray:
     """
-    Convert placement indices to piece coordinates.
-    
+    Convert placement indices to a packed solution array.
+
+    For the module-level placement table this is a single fancy-index
+    gather from ALL_PLACEMENTS_ARR instead of 54 Python-level copies.
+
     Args:
         placement_indices: List of row IDs (indices into all_placements)
         all_placements: List of all placements (each is tuple of cell indices)
-    
+
     Returns:
-        List of pieces, each piece is a list of (x,y,z) coordinates
+        (num_pieces, 4) uint8 array of packed cell indices; decode with
+        cells_to_coords when coordinates are needed
     """
-    pieces = []
-    for placement_idx in placement_indices:
-        cell_indices = all_placements[placement_idx]
-        coords = [index_to_point(cell_idx) for cell_idx in cell_indices]
-        pieces.append(coords)
-    return pieces
+    if all_placements is ALL_PLACEMENTS:
+        return ALL_PLACEMENTS_ARR[np.asarray(placement_indices, dtype=np.int32)]
+    return np.array(
+        [all_placements[placement_idx] for placement_idx in placement_indices],
+        dtype=np.uint8
+    )
 
 
 # =============================================================================
@@ -243,16 +511,68 @@ def get_symmetry_breaking_placements(all_placements: List[Tuple[int, ...]]) -> L
     """
     # Cell index for (0,0,0)
     origin_cell = point_to_index(0, 0, 0)
-    
+
     # Find all placements that cover the origin
     origin_placements = []
     for i, placement in enumerate(all_placements):
         if origin_cell in placement:
             origin_placements.append(i)
-    
+
     return origin_placements
 
 
+def _origin_stabilizer_perms() -> List[np.ndarray]:
+    """
+    Cell-index permutations of the rotations that fix the corner (0,0,0).
+
+    The stabilizer of a cube corner in the rotation group is the order-3
+    cyclic group of rotations about the main diagonal through that corner.
+    Each element is returned as NEW[old_index] = new_index, so a placement
+    (tuple of cell indices) maps to its rotated image by a direct gather.
+    """
+    # ROT already holds NEW[old] = new for every rotation; the stabilizer
+    # is exactly the rows that keep cell 0 (the corner) in place
+    return [rot for rot in ROT if rot[0] == 0]
+
+
+def get_canonical_origin_placements(all_placements: List[Tuple[int, ...]]) -> List[int]:
+    """
+    One origin-covering placement per orbit of the origin's stabilizer.
+
+    Every solution contains exactly one piece covering cell (0,0,0), and
+    the three rotations that fix that corner permute the origin-covering
+    placements among themselves. Restricting the matrix to one
+    representative per stabilizer orbit therefore keeps at least one
+    member of every solution class while cutting the root branching
+    factor by ~3x. (A single-cell constraint cannot break the full
+    24-element group - rotations that move the corner are handled, as
+    before, by canonical-fingerprint deduplication in SolutionSet.)
+
+    Args:
+        all_placements: List of all placements
+
+    Returns:
+        Sorted list of representative placement indices (covering origin)
+    """
+    stabilizer = _origin_stabilizer_perms()
+
+    # Placement cell-set -> placement index, for orbit lookup
+    placement_index = {frozenset(p): i for i, p in enumerate(all_placements)}
+
+    representatives = []
+    for i in get_symmetry_breaking_placements(all_placements):
+        cells = np.array(all_placements[i], dtype=np.int16)
+        # Keep i only if it has the smallest index in its stabilizer orbit
+        orbit_min = min(
+            placement_index[frozenset(int(c) for c in perm[cells])]
+            for perm in stabilizer
+        )
+        if i == orbit_min:
+            representatives.append(i)
+
+    return representatives
+
+
 # =============================================================================
 # VERIFICATION / TESTING
 # =============================================================================
@@ -307,22 +627,67 @@ def verify_symmetry() -> None:
         assert rotated_canonical == canonical, "Canonical form not invariant under rotation"
     print("✓ Canonical form is invariant under all cube rotations")
     
+    # Test packed cell round-trip
+    cells = coords_to_cells(test_solution)
+    decoded = cells_to_coords(cells)
+    assert decoded.tolist() == [[list(p) for p in piece] for piece in test_solution], \
+        "cells_to_coords must invert coords_to_cells"
+    print("✓ Packed cell representation round-trips")
+
     # Test SolutionSet
     sol_set = SolutionSet()
     
     # Add original solution
-    added1 = sol_set.add(test_solution)
+    added1 = sol_set.add(coords_to_cells(test_solution))
     assert added1, "First solution should be added"
-    
+
     # Add rotated version (should be rejected as duplicate)
     R = rotations[5]  # Some rotation
     rotated = rotate_solution(test_solution, R)
-    added2 = sol_set.add(rotated)
+    added2 = sol_set.add(coords_to_cells(rotated))
     assert not added2, "Rotated solution should be rejected as duplicate"
     
     assert len(sol_set) == 1, "Should have exactly 1 unique solution"
     print("✓ SolutionSet correctly identifies equivalent solutions")
-    
+
+    # Test the rotated-placement table: every row of RP is a permutation
+    # of the placement ids, and the identity rotation maps each id to itself
+    num_placements = len(ALL_PLACEMENTS)
+    for r in range(RP.shape[0]):
+        assert sorted(RP[r].tolist()) == list(range(num_placements)), \
+            f"RP[{r}] is not a permutation of placement ids"
+    identity_r = next(r for r in range(len(ROT))
+                      if (ROT[r] == np.arange(CUBE_SIZE ** 3)).all())
+    assert (RP[identity_r] == np.arange(num_placements)).all(), \
+        "Identity rotation must fix every placement id"
+
+    # Row-level canonical form must be invariant under rotation of the rows
+    test_rows = [0, 7, 100]
+    row_canonical = compute_canonical_form_rows(test_rows)
+    for r in range(RP.shape[0]):
+        rotated_rows = RP[r, test_rows].tolist()
+        assert compute_canonical_form_rows(rotated_rows) == row_canonical, \
+            "Row canonical form not invariant under rotation"
+    print("✓ Rotated-placement table and row canonical form are consistent")
+
+    # Test origin-stabilizer symmetry breaking
+    stabilizer = _origin_stabilizer_perms()
+    assert len(stabilizer) == 3, f"Corner stabilizer should have order 3, got {len(stabilizer)}"
+
+    origin = get_symmetry_breaking_placements(ALL_PLACEMENTS)
+    canonical = set(get_canonical_origin_placements(ALL_PLACEMENTS))
+    assert canonical <= set(origin), "Representatives must cover the origin"
+
+    # Every origin placement's stabilizer orbit must contain a representative
+    placement_index = {frozenset(p): i for i, p in enumerate(ALL_PLACEMENTS)}
+    for i in origin:
+        cells = np.array(ALL_PLACEMENTS[i], dtype=np.int16)
+        orbit = {placement_index[frozenset(int(c) for c in perm[cells])]
+                 for perm in stabilizer}
+        assert orbit & canonical, f"Orbit of placement {i} has no representative"
+    print(f"✓ Symmetry breaking: {len(origin)} origin placements -> "
+          f"{len(canonical)} stabilizer-orbit representatives")
+
     print("\n✓ Symmetry verification complete!")
 
 